@@ -0,0 +1,205 @@
+"""
+Persistent pool of pre-generated AI quiz questions per (topic, difficulty).
+
+Starting an AI quiz takes its questions from ai_question_pool.db instead of
+waiting on Gemini. Each question is served once and then deleted; when
+serving leaves a topic below LOW_WATER_MARK questions a background thread
+asks Gemini for more until it holds REFILL_TARGET again. Only topics that
+have been served are refilled, and refill requests are capped per hour
+across all topics.
+"""
+
+import collections
+import json
+import queue
+import sqlite3
+import threading
+import time
+
+POOL_DB_PATH = 'ai_question_pool.db'
+LOW_WATER_MARK = 15
+REFILL_TARGET = 40
+# Questions asked for per Gemini request while refilling
+REFILL_BATCH = 10
+# Gemini requests the refill worker may make per REFILL_WINDOW seconds, all topics together
+MAX_REFILL_REQUESTS = 20
+REFILL_WINDOW = 3600
+# A refill gives up after this many failed requests in a row and the topic is
+# left alone for REFILL_COOLDOWN seconds (bad API key, quota, outage)
+MAX_FAILED_REQUESTS = 3
+REFILL_COOLDOWN = 300
+
+
+class AIQuestionPool:
+    """Stock of validated AI questions with an asynchronous refill worker.
+
+    ``generate(num_questions, topic, difficulty)`` is called on the worker
+    thread. It returns a list of new validated question dicts, empty when
+    every question it got was a duplicate, and raises when the request
+    fails. A fully duplicated batch ends the refill (the topic is saturated
+    for now) without counting as a failure. One refill per (topic,
+    difficulty) is queued at a time.
+    """
+
+    def __init__(self, generate, db_path=POOL_DB_PATH, low_water_mark=LOW_WATER_MARK, target=REFILL_TARGET):
+        self.generate = generate
+        self.db_path = db_path
+        self.low_water_mark = low_water_mark
+        self.target = target
+        self._queue = queue.Queue()
+        self._pending = set()
+        self._failed_at = {}
+        self._request_times = collections.deque()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._table_ready = False
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        if not self._table_ready:
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS pooled_questions (
+                id INTEGER PRIMARY KEY,
+                topic TEXT NOT NULL,
+                difficulty TEXT NOT NULL,
+                question TEXT NOT NULL,
+                options TEXT NOT NULL,
+                correct INTEGER NOT NULL,
+                explanation TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_pooled_questions_key ON pooled_questions (topic, difficulty)')
+            conn.commit()
+            self._table_ready = True
+        return conn
+
+    def count(self, topic, difficulty):
+        conn = self._connect()
+        try:
+            return conn.execute(
+                'SELECT COUNT(*) FROM pooled_questions WHERE topic = ? AND difficulty = ?', (topic, difficulty)
+            ).fetchone()[0]
+        finally:
+            conn.close()
+
+    def add(self, topic, difficulty, questions):
+        conn = self._connect()
+        try:
+            conn.executemany(
+                'INSERT INTO pooled_questions (topic, difficulty, question, options, correct, explanation) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                [(topic, difficulty, q['question'], json.dumps(q['options']), q['correct'], q.get('explanation', ''))
+                 for q in questions]
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def take(self, topic, difficulty, num_questions):
+        """Remove and return up to num_questions random pooled questions.
+
+        Queues a refill if the request was served in full and left the topic
+        below the low-water mark. When the pool comes up short the caller is
+        about to generate the rest itself, so it should call
+        request_refill() once that is done rather than have both hit Gemini
+        at once. Returns [] if the pool cannot be read.
+        """
+        try:
+            conn = self._connect()
+            try:
+                conn.execute('BEGIN IMMEDIATE')
+                rows = conn.execute(
+                    'SELECT id, question, options, correct, explanation FROM pooled_questions '
+                    'WHERE topic = ? AND difficulty = ? ORDER BY RANDOM() LIMIT ?',
+                    (topic, difficulty, num_questions)
+                ).fetchall()
+                conn.executemany('DELETE FROM pooled_questions WHERE id = ?', [(row[0],) for row in rows])
+                remaining = conn.execute(
+                    'SELECT COUNT(*) FROM pooled_questions WHERE topic = ? AND difficulty = ?', (topic, difficulty)
+                ).fetchone()[0]
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"AI question pool unavailable: {e}")
+            return []
+
+        if len(rows) == num_questions and remaining < self.low_water_mark:
+            self.request_refill(topic, difficulty)
+        return [{'question': question, 'options': json.loads(options), 'correct': correct,
+                 'explanation': explanation} for _, question, options, correct, explanation in rows]
+
+    def request_refill(self, topic, difficulty):
+        key = (topic, difficulty)
+        with self._lock:
+            if key in self._pending or time.monotonic() - self._failed_at.get(key, -REFILL_COOLDOWN) < REFILL_COOLDOWN:
+                return
+            self._pending.add(key)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='ai-question-refill', daemon=True)
+                self._thread.start()
+        self._queue.put(key)
+
+    def _run(self):
+        while True:
+            topic, difficulty = self._queue.get()
+            try:
+                self._refill(topic, difficulty)
+            except Exception as e:
+                print(f"Error refilling AI question pool: {str(e)}")
+                with self._lock:
+                    self._failed_at[(topic, difficulty)] = time.monotonic()
+            finally:
+                with self._lock:
+                    self._pending.discard((topic, difficulty))
+                self._queue.task_done()
+
+    def _reserve_request(self):
+        """Count one Gemini request against the hourly cap; False if the cap is used up"""
+        now = time.monotonic()
+        with self._lock:
+            while self._request_times and now - self._request_times[0] >= REFILL_WINDOW:
+                self._request_times.popleft()
+            if len(self._request_times) >= MAX_REFILL_REQUESTS:
+                return False
+            self._request_times.append(now)
+            return True
+
+    def _refill(self, topic, difficulty):
+        failures = 0
+        while self.count(topic, difficulty) < self.target:
+            if not self._reserve_request():
+                return
+            try:
+                questions = self.generate(REFILL_BATCH, topic, difficulty)
+            except Exception as e:
+                failures += 1
+                if failures >= MAX_FAILED_REQUESTS:
+                    print(f"AI question refill for {topic} ({difficulty}) paused: {str(e)}")
+                    with self._lock:
+                        self._failed_at[(topic, difficulty)] = time.monotonic()
+                    return
+                continue
+            if not questions:
+                return
+            failures = 0
+            self.add(topic, difficulty, questions)
+
+    def wait_for_refills(self):
+        """Block until every queued refill has finished"""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_ai_question_pool(generate):
+    """Return the process-wide AI question pool, created with ``generate`` on first use"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = AIQuestionPool(generate)
+        return _pool
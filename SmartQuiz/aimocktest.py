@@ -5,14 +5,43 @@ from datetime import datetime, timedelta
 import json
 import os
 import google.generativeai as genai
-from config.QuestionBank import QUESTION_BANK
+from SmartQuiz.question_store import get_question_store
+from SmartQuiz.question_index import get_question_index
+from SmartQuiz.ai_question_pool import get_ai_question_pool
 from config.fallback_questions import create_fallback_questions
 
 
 genai.configure(api_key="GOOGLE_API_KEY")
 
 def generate_aptitude_mcqs_gemini(num_questions=5, topic="Mixed Aptitude", difficulty="medium"):
-    """Generate AI questions using Gemini API"""
+    """Get AI questions: from the prefetched pool first, then a live Gemini call,
+    then the fallback bank for whatever is still missing"""
+    pool = get_ai_question_pool(fetch_gemini_questions)
+    questions = pool.take(topic, difficulty, num_questions)
+    
+    if len(questions) < num_questions:
+        questions.extend(request_gemini_questions(num_questions - len(questions), topic, difficulty))
+        # Restock only after the live call, so the two don't compete for quota
+        pool.request_refill(topic, difficulty)
+    
+    if len(questions) < num_questions:
+        needed = num_questions - len(questions)
+        questions.extend(create_fallback_questions(needed, topic, difficulty))
+    
+    return questions[:num_questions]
+
+def request_gemini_questions(num_questions, topic, difficulty):
+    """Generate AI questions using Gemini API; returns only validated questions
+    not seen before, which may be fewer than asked for or none"""
+    try:
+        return fetch_gemini_questions(num_questions, topic, difficulty)
+    except Exception:
+        return []
+
+def fetch_gemini_questions(num_questions, topic, difficulty):
+    """Generate AI questions using Gemini API, raising if the request fails or
+    returns nothing usable. An empty list means every valid question was a
+    duplicate of one already in the question index."""
   
     difficulty_desc = {
         'easy': 'basic and simple level suitable for beginners',
@@ -56,47 +85,37 @@ OUTPUT FORMAT - Return ONLY valid JSON array:
 Generate exactly {num_questions} questions now. Return only the JSON array, no other text.
 """
     
-    try:
-        model = genai.GenerativeModel("gemini-1.5-flash")
-        response = model.generate_content(
-            prompt,
-            generation_config={
-                "temperature": 0.7,
-                "top_p": 0.8,
-                "top_k": 40,
-                "max_output_tokens": 2048,
-            }
-        )
-        
-        if not response or not response.text:
-            return create_fallback_questions(num_questions, topic, difficulty)
-        
-        # Clean response text
-        text = response.text.strip()
-        json_text = extract_json_from_response(text)
-        
-        if not json_text:
-            return create_fallback_questions(num_questions, topic, difficulty)
-        
-        try:
-            mcqs = json.loads(json_text)
-        except json.JSONDecodeError:
-            return create_fallback_questions(num_questions, topic, difficulty)
-        
-        formatted_questions = validate_and_format_questions(mcqs, num_questions)
-        
-        if len(formatted_questions) == 0:
-            return create_fallback_questions(num_questions, topic, difficulty)
-        
-        if len(formatted_questions) < num_questions:
-            needed = num_questions - len(formatted_questions)
-            fallback = create_fallback_questions(needed, topic, difficulty)
-            formatted_questions.extend(fallback)
-        
-        return formatted_questions[:num_questions]
-        
-    except Exception:
-        return create_fallback_questions(num_questions, topic, difficulty)
+    model = genai.GenerativeModel("gemini-1.5-flash")
+    response = model.generate_content(
+        prompt,
+        generation_config={
+            "temperature": 0.7,
+            "top_p": 0.8,
+            "top_k": 40,
+            "max_output_tokens": 2048,
+        }
+    )
+    
+    if not response or not response.text:
+        raise ValueError("Empty response from Gemini")
+    
+    # Clean response text
+    text = response.text.strip()
+    json_text = extract_json_from_response(text)
+    
+    if not json_text:
+        raise ValueError("No JSON in Gemini response")
+    
+    mcqs = json.loads(json_text)
+    
+    formatted_questions = validate_and_format_questions(mcqs, num_questions)
+    if not formatted_questions:
+        raise ValueError("Gemini returned no valid questions")
+    
+    # Drop questions already in the static or fallback banks or generated before
+    formatted_questions = get_question_index().filter_new(formatted_questions, ref=topic)
+    
+    return formatted_questions[:num_questions]
 
 def extract_json_from_response(text):
     """Extract JSON from response text"""
@@ -217,11 +236,24 @@ def get_category_display_name(category):
     }
     return category_names.get(category, '🌍 General Knowledge')
 
-def shuffle_questions(questions, num_questions):
-    """Shuffle and select required number of questions"""
-    shuffled = questions.copy()
-    random.shuffle(shuffled)
-    return shuffled[:num_questions]
+def sample_question_ids(store, category, difficulty, num_questions, exclude):
+    """Pick question ids: the chosen difficulty first, then the category's other
+    difficulties, then General Aptitude, never returning an id in exclude"""
+    exclude = set(exclude)
+    ids = store.sample_ids([(category, difficulty)], num_questions, exclude)
+    exclude.update(ids)
+    
+    # Add questions from other difficulties if needed
+    if len(ids) < num_questions:
+        other_difficulties = {diff: 1 for diff in ['easy', 'medium', 'hard'] if diff != difficulty}
+        ids += store.sample_stratified(category, num_questions - len(ids), other_difficulties, exclude)
+        exclude.update(ids)
+    
+    # If still not enough, use General Aptitude questions
+    if len(ids) < num_questions:
+        ids += store.sample_stratified('General Aptitude', num_questions - len(ids), exclude=exclude)
+    
+    return ids
 
 def generate_static_questions():
     """Generate questions from question bank"""
@@ -233,23 +265,25 @@ def generate_static_questions():
     if category == 'programming':
         category = st.session_state.quiz_state['programming_language']
     
-    # Get questions for selected difficulty
-    category_questions = QUESTION_BANK.get(category, QUESTION_BANK['General Aptitude'])
-    questions = category_questions.get(difficulty, []).copy()
+    store = get_question_store()
+    if not store.has_category(category):
+        category = 'General Aptitude'
     
-    # Add questions from other difficulties if needed
-    if len(questions) < num_questions:
-        for diff in ['easy', 'medium', 'hard']:
-            if diff != difficulty and diff in category_questions:
-                questions.extend(category_questions[diff])
+    # Ids of questions this user has already been given; kept outside
+    # quiz_state, which is reset when they go back to the menu
+    if 'seen_question_ids' not in st.session_state:
+        st.session_state.seen_question_ids = set()
+    seen = st.session_state.seen_question_ids
     
-    # If still not enough, use General Aptitude questions
-    if len(questions) < num_questions:
-        general_questions = QUESTION_BANK['General Aptitude']
-        for diff in ['easy', 'medium', 'hard']:
-            questions.extend(general_questions.get(diff, []))
+    ids = sample_question_ids(store, category, difficulty, num_questions, seen)
+    
+    # Once every question has been seen, allow repeats rather than a short quiz
+    if len(ids) < num_questions:
+        ids += sample_question_ids(store, category, difficulty, num_questions - len(ids), ids)
     
-    return shuffle_questions(questions, num_questions)
+    seen.update(ids)
+    random.shuffle(ids)
+    return store.get_by_ids(ids)
 
 def start_question_timer():
     """Start timer for current question"""
@@ -0,0 +1,308 @@
+"""
+Duplicate and near-duplicate index over quiz questions: the static question
+bank, the AI practice-set fallback banks and every AI-generated question
+accepted so far.
+
+Each question (stem plus its options, order ignored) is reduced to a set of
+token 3-shingles and a MinHash signature. Exact repeats are found through a
+hash of the normalized text, near repeats through LSH buckets over bands of
+the signature, so a lookup costs O(1) expected time regardless of how many
+questions are indexed. Signatures are kept in question_index.db and only
+recomputed when a bank source file changes.
+
+    python -m SmartQuiz.question_index        # duplicate report for maintainers
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import random
+import re
+import sqlite3
+import threading
+
+import numpy as np
+
+from config.fallback_questions import FALLBACK_BANKS
+from SmartQuiz.question_store import get_question_store
+
+INDEX_DB_PATH = 'question_index.db'
+SOURCE_MODULES = ['config.QuestionBank', 'config.fallback_questions']
+
+SHINGLE_SIZE = 3
+NUM_PERMUTATIONS = 64
+LSH_BANDS = 16  # 4 signature rows per band
+# Estimated Jaccard similarity from which two questions count as near duplicates
+NEAR_DUPLICATE_THRESHOLD = 0.7
+
+# Words, numbers and single punctuation marks, so "x++" and "x--" stay different
+TOKEN_RE = re.compile(r'\w+|[^\w\s]')
+
+# Universal hashes h(x) = (a*x + b) mod p over 32-bit shingle hashes; a < 2**31
+# keeps a*x + b inside uint64
+_PRIME = 4294967291
+_rng = random.Random(20240601)
+_HASH_A = np.array([_rng.randrange(1, 1 << 31) for _ in range(NUM_PERMUTATIONS)], dtype=np.uint64)
+_HASH_B = np.array([_rng.randrange(0, _PRIME) for _ in range(NUM_PERMUTATIONS)], dtype=np.uint64)
+
+
+def normalize_question(question):
+    """Lowercased tokens of the stem followed by the sorted options, joined by spaces"""
+    options = sorted(' '.join(TOKEN_RE.findall(str(option).lower())) for option in question.get('options', []))
+    return ' '.join(TOKEN_RE.findall(str(question['question']).lower()) + options)
+
+
+def content_hash(text):
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def minhash_signature(text):
+    """NUM_PERMUTATIONS-long MinHash signature of the text's token shingles"""
+    tokens = text.split()
+    shingles = {' '.join(tokens[i:i + SHINGLE_SIZE]) for i in range(max(len(tokens) - SHINGLE_SIZE + 1, 1))}
+    hashes = np.array(
+        [int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=4).digest(), 'little')
+         for shingle in shingles],
+        dtype=np.uint64
+    )
+    return ((np.outer(hashes, _HASH_A) + _HASH_B) % _PRIME).min(axis=0)
+
+
+def _sources_fingerprint():
+    """SHA-256 over the bank source files and the signature parameters"""
+    digest = hashlib.sha256(f'{SHINGLE_SIZE}:{NUM_PERMUTATIONS}'.encode())
+    for module in SOURCE_MODULES:
+        with open(importlib.util.find_spec(module).origin, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _reference_questions():
+    """Yield (source, ref, question) for every question of the static and fallback banks"""
+    store = get_question_store()
+    for category, difficulty in store.slices():
+        for question in store.get_questions(category, difficulty):
+            yield 'bank', f'{category}/{difficulty}', question
+    for topic, questions in FALLBACK_BANKS.items():
+        for question in questions:
+            yield 'fallback', topic, question
+
+
+class QuestionIndex:
+    """Exact and MinHash/LSH near-duplicate lookups over indexed questions.
+
+    Rows from the static and fallback banks are rebuilt when their source
+    files change; rows added from AI generation (source 'ai') are kept and
+    only have their signatures recomputed.
+    """
+
+    def __init__(self, db_path=INDEX_DB_PATH, threshold=NEAR_DUPLICATE_THRESHOLD):
+        self.db_path = db_path
+        self.threshold = threshold
+        self._items = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS indexed_questions (
+            id INTEGER PRIMARY KEY,
+            source TEXT NOT NULL,
+            ref TEXT,
+            question TEXT NOT NULL,
+            normalized TEXT NOT NULL,
+            signature BLOB NOT NULL
+        )
+        ''')
+        conn.execute('CREATE TABLE IF NOT EXISTS index_meta (key TEXT PRIMARY KEY, value TEXT)')
+        return conn
+
+    def _rebuild(self, conn, fingerprint):
+        conn.execute("DELETE FROM indexed_questions WHERE source != 'ai'")
+        rows = []
+        for source, ref, question in _reference_questions():
+            normalized = normalize_question(question)
+            rows.append((source, ref, question['question'], normalized, minhash_signature(normalized).tobytes()))
+        conn.executemany(
+            'INSERT INTO indexed_questions (source, ref, question, normalized, signature) VALUES (?, ?, ?, ?, ?)',
+            rows
+        )
+        ai_rows = conn.execute("SELECT id, normalized FROM indexed_questions WHERE source = 'ai'").fetchall()
+        conn.executemany(
+            'UPDATE indexed_questions SET signature = ? WHERE id = ?',
+            [(minhash_signature(normalized).tobytes(), item_id) for item_id, normalized in ai_rows]
+        )
+        conn.execute("INSERT OR REPLACE INTO index_meta (key, value) VALUES ('sources_sha256', ?)", (fingerprint,))
+        conn.commit()
+
+    def _remember(self, item_id, source, ref, question, normalized, signature):
+        self._items[item_id] = {'id': item_id, 'source': source, 'ref': ref, 'question': question}
+        self._signatures[item_id] = signature
+        self._by_hash.setdefault(content_hash(normalized), []).append(item_id)
+        for band_key in self._band_keys(signature):
+            self._buckets.setdefault(band_key, []).append(item_id)
+
+    @staticmethod
+    def _band_keys(signature):
+        rows = NUM_PERMUTATIONS // LSH_BANDS
+        return [(band, signature[band * rows:(band + 1) * rows].tobytes()) for band in range(LSH_BANDS)]
+
+    def _ensure_loaded(self):
+        """Load the index into memory, rebuilding the bank rows first if their sources changed"""
+        if self._items is not None:
+            return
+        fingerprint = _sources_fingerprint()
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT value FROM index_meta WHERE key = 'sources_sha256'").fetchone()
+            if row is None or row[0] != fingerprint:
+                self._rebuild(conn, fingerprint)
+            rows = conn.execute(
+                'SELECT id, source, ref, question, normalized, signature FROM indexed_questions ORDER BY id'
+            ).fetchall()
+        finally:
+            conn.close()
+
+        self._items = {}
+        self._signatures = {}
+        self._by_hash = {}
+        self._buckets = {}
+        for item_id, source, ref, question, normalized, signature in rows:
+            self._remember(item_id, source, ref, question, normalized, np.frombuffer(signature, dtype=np.uint64))
+
+    def _find(self, normalized, signature):
+        exact = self._by_hash.get(content_hash(normalized))
+        if exact:
+            return self._items[exact[0]], 1.0
+
+        best_id, best_similarity = None, 0.0
+        candidates = {item_id for band_key in self._band_keys(signature)
+                      for item_id in self._buckets.get(band_key, ())}
+        for item_id in candidates:
+            similarity = float(np.mean(self._signatures[item_id] == signature))
+            if similarity > best_similarity:
+                best_id, best_similarity = item_id, similarity
+        if best_id is not None and best_similarity >= self.threshold:
+            return self._items[best_id], best_similarity
+        return None
+
+    def find_duplicate(self, question):
+        """Return (indexed item, estimated similarity) for the closest duplicate of question, or None"""
+        normalized = normalize_question(question)
+        with self._lock:
+            self._ensure_loaded()
+            return self._find(normalized, minhash_signature(normalized))
+
+    def filter_new(self, questions, source='ai', ref=None):
+        """Return the questions that duplicate nothing indexed (or earlier in the list) and index them.
+
+        If the index cannot be read or written the questions are returned
+        unchanged, so quiz generation never fails because of it.
+        """
+        try:
+            with self._lock:
+                self._ensure_loaded()
+                kept = []
+                conn = self._connect()
+                try:
+                    for question in questions:
+                        normalized = normalize_question(question)
+                        signature = minhash_signature(normalized)
+                        if self._find(normalized, signature) is not None:
+                            continue
+                        cursor = conn.execute(
+                            'INSERT INTO indexed_questions (source, ref, question, normalized, signature) '
+                            'VALUES (?, ?, ?, ?, ?)',
+                            (source, ref, question['question'], normalized, signature.tobytes())
+                        )
+                        self._remember(cursor.lastrowid, source, ref, question['question'], normalized, signature)
+                        kept.append(question)
+                    conn.commit()
+                finally:
+                    conn.close()
+                return kept
+        except sqlite3.Error as e:
+            print(f"Question index unavailable: {e}")
+            return questions
+
+    def duplicate_groups(self):
+        """Return groups of mutually (near-)duplicated items, largest first.
+
+        Each group is {'exact': True if every item has the same normalized
+        text, 'similarity': lowest estimated similarity linking the group,
+        'items': [{'id', 'source', 'ref', 'question'}, ...]}.
+        """
+        with self._lock:
+            self._ensure_loaded()
+            parent = {item_id: item_id for item_id in self._items}
+
+            def root(item_id):
+                while parent[item_id] != item_id:
+                    parent[item_id] = parent[parent[item_id]]
+                    item_id = parent[item_id]
+                return item_id
+
+            links = {}
+            for ids in list(self._by_hash.values()) + list(self._buckets.values()):
+                for i, first in enumerate(ids):
+                    for second in ids[i + 1:]:
+                        pair = (first, second)
+                        if pair in links:
+                            continue
+                        similarity = float(np.mean(self._signatures[first] == self._signatures[second]))
+                        if similarity < self.threshold:
+                            continue
+                        links[pair] = similarity
+                        parent[root(second)] = root(first)
+
+            exact_of = {item_id: digest for digest, ids in self._by_hash.items() for item_id in ids}
+            groups = {}
+            for item_id in self._items:
+                groups.setdefault(root(item_id), []).append(item_id)
+            lowest = {}
+            for (first, _), similarity in links.items():
+                group = root(first)
+                lowest[group] = min(lowest.get(group, 1.0), similarity)
+
+            report = []
+            for group, ids in groups.items():
+                if len(ids) < 2:
+                    continue
+                report.append({
+                    'exact': len({exact_of[item_id] for item_id in ids}) == 1,
+                    'similarity': lowest.get(group, 1.0),
+                    'items': [self._items[item_id] for item_id in ids]
+                })
+            report.sort(key=lambda group: (-len(group['items']), group['similarity']))
+            return report
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_question_index():
+    """Return the process-wide question index"""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = QuestionIndex()
+        return _index
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Report duplicated and near-duplicated quiz questions')
+    parser.add_argument('--threshold', type=float, default=NEAR_DUPLICATE_THRESHOLD,
+                        help='estimated Jaccard similarity from which questions count as near duplicates')
+    args = parser.parse_args()
+
+    index = QuestionIndex(threshold=args.threshold)
+    groups = index.duplicate_groups()
+    exact = sum(1 for group in groups if group['exact'])
+    print(f"{len(groups)} duplicate groups ({exact} exact, {len(groups) - exact} near)\n")
+    for group in groups:
+        label = 'exact' if group['exact'] else f"near, similarity >= {group['similarity']:.2f}"
+        print(f"[{label}] {len(group['items'])} items")
+        for item in group['items']:
+            print(f"    {item['source']:<9}{item['ref'] or '':<32}{item['question'][:80]!r}")
+        print()
@@ -0,0 +1,263 @@
+"""
+Indexed SQLite copy of config/QuestionBank.py for the static quiz.
+
+The bank is a ~5,000 line dict literal; importing it parses and keeps every
+question of every category in memory. The store is compiled from it once
+(and again whenever the source file changes), after which questions are
+read per (category, difficulty) only when a quiz needs them.
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import random
+import sqlite3
+import sys
+import threading
+
+STORE_DB_PATH = 'question_bank.db'
+SOURCE_MODULE = 'config.QuestionBank'
+DIFFICULTIES = ['easy', 'medium', 'hard']
+
+
+def _load_bank():
+    """Execute the question bank source and return its QUESTION_BANK.
+
+    Unless the app already imported it, the module is run from its spec
+    without registering it in sys.modules or on the config package, so
+    nothing refers to the bank once the store has been built and it can be
+    freed.
+    """
+    if SOURCE_MODULE in sys.modules:
+        return sys.modules[SOURCE_MODULE].QUESTION_BANK
+    spec = importlib.util.find_spec(SOURCE_MODULE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.QUESTION_BANK
+
+
+def _source_fingerprint():
+    """SHA-256 of the question bank source, read without importing it"""
+    spec = importlib.util.find_spec(SOURCE_MODULE)
+    with open(spec.origin, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class QuestionStore:
+    """Questions of config.QuestionBank indexed by (category, difficulty).
+
+    Rows are inserted one (category, difficulty) slice at a time, so every
+    slice occupies a contiguous id range; the ranges are kept in memory and
+    make counting a slice free and fetching any subset of it a primary-key
+    lookup.
+    """
+
+    def __init__(self, db_path=STORE_DB_PATH):
+        self.db_path = db_path
+        self._ranges = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=5)
+
+    def _build(self, fingerprint):
+        """Compile the bank into a fresh database file and swap it into place"""
+        bank = _load_bank()
+
+        temp_path = self.db_path + '.tmp'
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        conn = sqlite3.connect(temp_path)
+        try:
+            conn.execute('''
+            CREATE TABLE questions (
+                id INTEGER PRIMARY KEY,
+                category TEXT NOT NULL,
+                difficulty TEXT NOT NULL,
+                question TEXT NOT NULL,
+                options TEXT NOT NULL,
+                correct INTEGER NOT NULL,
+                explanation TEXT
+            )
+            ''')
+            conn.execute('CREATE INDEX idx_questions_slice ON questions (category, difficulty)')
+            conn.execute('CREATE TABLE store_meta (key TEXT PRIMARY KEY, value TEXT)')
+            for category, difficulties in bank.items():
+                for difficulty, questions in difficulties.items():
+                    conn.executemany(
+                        'INSERT INTO questions (category, difficulty, question, options, correct, explanation) '
+                        'VALUES (?, ?, ?, ?, ?, ?)',
+                        [(category, difficulty, q['question'], json.dumps(q['options']), q['correct'],
+                          q.get('explanation', '')) for q in questions]
+                    )
+            conn.execute("INSERT INTO store_meta (key, value) VALUES ('source_sha256', ?)", (fingerprint,))
+            conn.commit()
+        finally:
+            conn.close()
+        os.replace(temp_path, self.db_path)
+
+    def _stored_fingerprint(self):
+        if not os.path.exists(self.db_path):
+            return None
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute("SELECT value FROM store_meta WHERE key = 'source_sha256'").fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    def _load_ranges(self):
+        """Return {(category, difficulty): (first id, count)}, building the store if it is stale"""
+        with self._lock:
+            if self._ranges is None:
+                fingerprint = _source_fingerprint()
+                if self._stored_fingerprint() != fingerprint:
+                    self._build(fingerprint)
+                conn = self._connect()
+                try:
+                    rows = conn.execute(
+                        'SELECT category, difficulty, MIN(id), COUNT(*) FROM questions GROUP BY category, difficulty'
+                    ).fetchall()
+                finally:
+                    conn.close()
+                self._ranges = {(category, difficulty): (first_id, count)
+                                for category, difficulty, first_id, count in rows}
+            return self._ranges
+
+    def categories(self):
+        return sorted({category for category, _ in self._load_ranges()})
+
+    def slices(self):
+        """Return every (category, difficulty) key in the store"""
+        return sorted(self._load_ranges())
+
+    def has_category(self, category):
+        return any(key[0] == category for key in self._load_ranges())
+
+    def count(self, category, difficulty):
+        return self._load_ranges().get((category, difficulty), (0, 0))[1]
+
+    def _fetch(self, where, params):
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                f'SELECT question, options, correct, explanation FROM questions WHERE {where} ORDER BY id', params
+            ).fetchall()
+        finally:
+            conn.close()
+        return [{'question': question, 'options': json.loads(options), 'correct': correct,
+                 'explanation': explanation} for question, options, correct, explanation in rows]
+
+    def get_questions(self, category, difficulty):
+        """Return every question of one (category, difficulty) slice as QuestionBank-style dicts"""
+        first_id, count = self._load_ranges().get((category, difficulty), (0, 0))
+        if not count:
+            return []
+        return self._fetch('id BETWEEN ? AND ?', (first_id, first_id + count - 1))
+
+    def get_by_ids(self, ids):
+        """Return the questions with these store ids, in the order given"""
+        ids = list(ids)
+        if not ids:
+            return []
+        self._load_ranges()
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                f'SELECT id, question, options, correct, explanation FROM questions '
+                f'WHERE id IN ({", ".join("?" * len(ids))})', ids
+            ).fetchall()
+        finally:
+            conn.close()
+        by_id = {row[0]: {'question': row[1], 'options': json.loads(row[2]), 'correct': row[3],
+                          'explanation': row[4]} for row in rows}
+        return [by_id[question_id] for question_id in ids if question_id in by_id]
+
+    def _slice_ranges(self, slices):
+        ranges = self._load_ranges()
+        return [ranges[key] for key in slices if ranges.get(key, (0, 0))[1]]
+
+    @staticmethod
+    def _excluded_in(ranges, exclude):
+        return {question_id for question_id in exclude
+                if any(first_id <= question_id < first_id + count for first_id, count in ranges)}
+
+    def available(self, slices, exclude=()):
+        """Number of questions in these (category, difficulty) slices whose ids are not in exclude"""
+        ranges = self._slice_ranges(slices)
+        return sum(count for _, count in ranges) - len(self._excluded_in(ranges, exclude))
+
+    def sample_ids(self, slices, k, exclude=(), rng=random):
+        """Draw up to k distinct question ids uniformly from the union of slices, skipping exclude.
+
+        Ids are drawn by position in the slices' id ranges and rejected if
+        excluded or already taken, so the cost is O(k + len(exclude)) while
+        most of the pool is still available. Only when fewer than 2k
+        questions are left are the remaining ids listed and sampled directly.
+        """
+        ranges = self._slice_ranges(slices)
+        total = sum(count for _, count in ranges)
+        excluded = self._excluded_in(ranges, exclude)
+        remaining = total - len(excluded)
+        if k <= 0 or remaining <= 0:
+            return []
+
+        if remaining < 2 * k:
+            pool = [question_id for first_id, count in ranges
+                    for question_id in range(first_id, first_id + count) if question_id not in excluded]
+            return rng.sample(pool, min(k, len(pool)))
+
+        picked = []
+        taken = set()
+        while len(picked) < k:
+            position = rng.randrange(total)
+            for first_id, count in ranges:
+                if position < count:
+                    question_id = first_id + position
+                    break
+                position -= count
+            if question_id in excluded or question_id in taken:
+                continue
+            taken.add(question_id)
+            picked.append(question_id)
+        return picked
+
+    def sample_stratified(self, category, k, weights=None, exclude=(), rng=random):
+        """Draw up to k question ids from one category, split across difficulties by weight.
+
+        ``weights`` maps difficulty to a relative share (all difficulties
+        equally by default). Seats are handed out one at a time to the
+        difficulty furthest below its share, skipping difficulties that have
+        run out, so a short difficulty's seats go to the others.
+        """
+        weights = weights or {difficulty: 1 for difficulty in DIFFICULTIES}
+        available = {difficulty: self.available([(category, difficulty)], exclude)
+                     for difficulty, weight in weights.items() if weight > 0}
+        quotas = {difficulty: 0 for difficulty in available}
+        for _ in range(min(k, sum(available.values()))):
+            open_difficulties = [d for d in quotas if quotas[d] < available[d]]
+            chosen = max(open_difficulties, key=lambda d: weights[d] / (quotas[d] + 1))
+            quotas[chosen] += 1
+
+        picked = []
+        for difficulty, quota in quotas.items():
+            picked.extend(self.sample_ids([(category, difficulty)], quota, exclude, rng))
+        rng.shuffle(picked)
+        return picked
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_question_store():
+    """Return the process-wide question store"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = QuestionStore()
+        return _store
@@ -17,7 +17,8 @@ import requests
 from config.courses import COURSES_BY_CATEGORY, RESUME_VIDEOS, INTERVIEW_VIDEOS, get_courses_for_role, get_category_for_role
 from config.job_roles import JOB_ROLES
 from config.database import (
-    get_database_connection, save_resume_data, save_analysis_data,
+    get_database_connection,
+    queue_resume_data, queue_resume_with_analysis, queue_resumes_with_analyses,
     init_database, verify_admin, log_admin_action, save_ai_analysis_data,
     get_ai_analysis_stats, reset_ai_analysis_stats, get_detailed_ai_analysis_stats
 )
@@ -34,6 +35,8 @@ from utils.ai_resume_analyzer import AIResumeAnalyzer
 from utils.resume_builder import ResumeBuilder
 from utils.portfolio_builder import PortfolioBuilder
 from utils.resume_analyzer import ResumeAnalyzer
+from utils.batch_analyzer import BatchResumeAnalyzer
+from utils.text_extraction import get_text_extractor
 from SmartQuiz.aimocktest import run_quiz 
 
 import traceback
@@ -45,6 +48,7 @@ from dotenv import load_dotenv
 import os
 
 load_dotenv()  # Load from .env file
+
 google_api_key = os.getenv("GOOGLE_API_KEY")
 
 if not google_api_key:
@@ -106,6 +110,8 @@ class ResumeApp:
         # Initialize dashboard manager
         self.dashboard_manager = DashboardManager()
         self.analyzer = ResumeAnalyzer()
+        self.batch_analyzer = BatchResumeAnalyzer()
+        self.text_extractor = get_text_extractor()
         self.ai_analyzer = AIResumeAnalyzer()
         self.portfolio_builder = PortfolioBuilder()  # <-- ADD THIS
 
@@ -133,6 +139,9 @@ class ResumeApp:
 
         if 'resume_data' not in st.session_state:
             st.session_state.resume_data = []
+        # Background database writes whose outcome has not been shown yet
+        if 'pending_saves' not in st.session_state:
+            st.session_state.pending_saves = []
         if 'ai_analysis_stats' not in st.session_state:
             st.session_state.ai_analysis_stats = {
                 'score_distribution': {},
@@ -1600,8 +1609,8 @@ class ResumeApp:
                     resume_buffer = self.builder.generate_resume(resume_data)
                     if resume_buffer:
                         try:
-                            # Save resume data to database
-                            save_resume_data(resume_data)
+                            # Save resume data to database in the background
+                            saved = queue_resume_data(resume_data)
 
                             # Offer the resume for download
                             st.success("✅ Resume generated successfully!")
@@ -1615,6 +1624,9 @@ class ResumeApp:
         ' ', '_')}_resume.docx",
                                 mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
                             )
+
+                            # The download doesn't depend on the save, but say if it was lost
+                            self._track_save(saved, None, "⚠️ Resume generated but couldn't be saved to database")
                         except Exception as db_error:
                             print(
     f"Warning: Failed to save to database: {
@@ -3022,44 +3034,28 @@ class ResumeApp:
 
                 if analyze_standard:
                     with st.spinner("Analyzing your document..."):
-                        # Get file content
-                        text = ""
-                        try:
-                            if uploaded_file.type == "application/pdf":
+                        # Uploads that are clearly a certificate, marksheet or ID card are rejected from their first pages
+                        analysis, page_count = self.analyzer.screen_document(uploaded_file, uploaded_file.type)
+                        if analysis is None:
+                            # Get file content
+                            text = ""
+                            try:
+                                # Backends are tried fastest first and only escalate on a bad result
                                 try:
-                                    text = self.analyzer.extract_text_from_pdf(uploaded_file)
-                                except Exception as pdf_error:
-                                    st.error(f"PDF extraction failed: {str(pdf_error)}")
-                                    st.info("Trying alternative PDF extraction method...")
-                                    # Try AI analyzer as backup
-                                    try:
-                                        text = self.ai_analyzer.extract_text_from_pdf(uploaded_file)
-                                    except Exception as backup_error:
-                                        st.error(f"All PDF extraction methods failed: {str(backup_error)}")
-                                        return
-                            elif uploaded_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-                                try:
-                                    text = self.analyzer.extract_text_from_docx(uploaded_file)
-                                except Exception as docx_error:
-                                    st.error(f"DOCX extraction failed: {str(docx_error)}")
-                                    # Try AI analyzer as backup
-                                    try:
-                                        text = self.ai_analyzer.extract_text_from_docx(uploaded_file)
-                                    except Exception as backup_error:
-                                        st.error(f"All DOCX extraction methods failed: {str(backup_error)}")
-                                        return
-                            else:
-                                text = uploaded_file.getvalue().decode()
+                                    text = self.text_extractor.extract(uploaded_file, uploaded_file.type, page_count)
+                                except Exception as extraction_error:
+                                    st.error(str(extraction_error))
+                                    return
                                 
-                            if not text or text.strip() == "":
-                                st.error("Could not extract any text from the uploaded file. Please try a different file.")
+                                if not text or text.strip() == "":
+                                    st.error("Could not extract any text from the uploaded file. Please try a different file.")
+                                    return
+                            except Exception as e:
+                                st.error(f"Error reading file: {str(e)}")
                                 return
-                        except Exception as e:
-                            st.error(f"Error reading file: {str(e)}")
-                            return
 
-                        # Analyze the document
-                        analysis = self.analyzer.analyze_resume({'raw_text': text}, role_info)
+                            # Analyze the document
+                            analysis = self.analyzer.analyze_resume({'raw_text': text}, role_info)
                         
                         # Check if analysis returned an error
                         if 'error' in analysis:
@@ -3067,42 +3063,10 @@ class ResumeApp:
                             return
 
 
-                        # Save resume data to database
-                        resume_data = {
-                            'personal_info': {
-                                'name': analysis.get('name', ''),
-                                'email': analysis.get('email', ''),
-                                'phone': analysis.get('phone', ''),
-                                'linkedin': analysis.get('linkedin', ''),
-                                'github': analysis.get('github', ''),
-                                'portfolio': analysis.get('portfolio', '')
-                            },
-                            'summary': analysis.get('summary', ''),
-                            'target_role': selected_role,
-                            'target_category': selected_category,
-                            'education': analysis.get('education', []),
-                            'experience': analysis.get('experience', []),
-                            'projects': analysis.get('projects', []),
-                            'skills': analysis.get('skills', []),
-                            'template': ''
-                        }
-
-                        # Save to database
+                        # Save resume and analysis in the background so results render without waiting on disk
                         try:
-                            resume_id = save_resume_data(resume_data)
-
-                            # Save analysis data
-                            analysis_data = {
-                                'resume_id': resume_id,
-                                'ats_score': analysis['ats_score'],
-                                'keyword_match_score': analysis['keyword_match']['score'],
-                                'format_score': analysis['format_score'],
-                                'section_score': analysis['section_score'],
-                                'missing_skills': ','.join(analysis['keyword_match']['missing_skills']),
-                                'recommendations': ','.join(analysis['suggestions'])
-                            }
-                            save_analysis_data(resume_id, analysis_data)
-                            st.success("Resume data saved successfully!")
+                            resume_data, analysis_data = self._build_analysis_records(analysis, selected_role, selected_category)
+                            self._track_save(queue_resume_with_analysis(resume_data, analysis_data))
                         except Exception as e:
                             st.error(f"Error saving to database: {str(e)}")
                             print(f"Database error: {e}")
@@ -3595,47 +3559,83 @@ class ResumeApp:
                  if analyze_multiple:
                      self._analyze_multiple_resumes(uploaded_files, role_info_multi, selected_role_multi, selected_category_multi)
      
+    def _build_analysis_records(self, analysis, selected_role, selected_category):
+         """Build the resume_data and resume_analysis rows for one analyzed resume"""
+         resume_data = {
+             'personal_info': {
+                 'name': analysis.get('name', ''),
+                 'email': analysis.get('email', ''),
+                 'phone': analysis.get('phone', ''),
+                 'linkedin': analysis.get('linkedin', ''),
+                 'github': analysis.get('github', ''),
+                 'portfolio': analysis.get('portfolio', '')
+             },
+             'summary': analysis.get('summary', ''),
+             'target_role': selected_role,
+             'target_category': selected_category,
+             'education': analysis.get('education', []),
+             'experience': analysis.get('experience', []),
+             'projects': analysis.get('projects', []),
+             'skills': analysis.get('skills', []),
+             'template': ''
+         }
+         analysis_data = {
+             'ats_score': analysis['ats_score'],
+             'keyword_match_score': analysis['keyword_match']['score'],
+             'format_score': analysis['format_score'],
+             'section_score': analysis['section_score'],
+             'missing_skills': ','.join(analysis['keyword_match']['missing_skills']),
+             'recommendations': ','.join(analysis['suggestions'])
+         }
+         return resume_data, analysis_data
+
+    def _track_save(self, pending, success_message="Resume data saved!", failure_message=None):
+         """Remember a queued background write; its outcome is shown once it has finished"""
+         st.session_state.pending_saves.append((pending, success_message, failure_message))
+
+    def _report_pending_saves(self):
+         """Show the outcome of finished background writes without waiting for unfinished ones.
+
+         Writes still in progress stay pending and are reported on a later rerun.
+         """
+         still_pending = []
+         for pending, success_message, failure_message in st.session_state.get('pending_saves', []):
+             if not pending.done():
+                 still_pending.append((pending, success_message, failure_message))
+             elif pending.exception() is not None:
+                 print(f"Database error: {pending.exception()}")
+                 st.error(failure_message or f"Error saving to database: {str(pending.exception())}")
+             elif success_message:
+                 st.success(success_message)
+         st.session_state.pending_saves = still_pending
+         if still_pending:
+             st.info("Resume data is still being saved in the background; it may not appear in the dashboard yet.")
+     
     def _analyze_single_resume(self, uploaded_file, role_info, selected_role, selected_category):
          """Analyze a single resume (existing functionality)"""
          with st.spinner("Analyzing your document..."):
-             # Get file content
-             text = ""
-             try:
-                 if uploaded_file.type == "application/pdf":
-                     try:
-                         text = self.analyzer.extract_text_from_pdf(uploaded_file)
-                     except Exception as pdf_error:
-                         st.error(f"PDF extraction failed: {str(pdf_error)}")
-                         st.info("Trying alternative PDF extraction method...")
-                         # Try AI analyzer as backup
-                         try:
-                             text = self.ai_analyzer.extract_text_from_pdf(uploaded_file)
-                         except Exception as backup_error:
-                             st.error(f"All PDF extraction methods failed: {str(backup_error)}")
-                             return
-                 elif uploaded_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
+             # Uploads that are clearly a certificate, marksheet or ID card are rejected from their first pages
+             analysis, page_count = self.analyzer.screen_document(uploaded_file, uploaded_file.type)
+             if analysis is None:
+                 # Get file content
+                 text = ""
+                 try:
+                     # Backends are tried fastest first and only escalate on a bad result
                      try:
-                         text = self.analyzer.extract_text_from_docx(uploaded_file)
-                     except Exception as docx_error:
-                         st.error(f"DOCX extraction failed: {str(docx_error)}")
-                         # Try AI analyzer as backup
-                         try:
-                             text = self.ai_analyzer.extract_text_from_docx(uploaded_file)
-                         except Exception as backup_error:
-                             st.error(f"All DOCX extraction methods failed: {str(backup_error)}")
-                             return
-                 else:
-                     text = uploaded_file.getvalue().decode()
+                         text = self.text_extractor.extract(uploaded_file, uploaded_file.type, page_count)
+                     except Exception as extraction_error:
+                         st.error(str(extraction_error))
+                         return
                      
-                 if not text or text.strip() == "":
-                     st.error("Could not extract any text from the uploaded file. Please try a different file.")
+                     if not text or text.strip() == "":
+                         st.error("Could not extract any text from the uploaded file. Please try a different file.")
+                         return
+                 except Exception as e:
+                     st.error(f"Error reading file: {str(e)}")
                      return
-             except Exception as e:
-                 st.error(f"Error reading file: {str(e)}")
-                 return
      
-             # Analyze the document
-             analysis = self.analyzer.analyze_resume({'raw_text': text}, role_info)
+                 # Analyze the document
+                 analysis = self.analyzer.analyze_resume({'raw_text': text}, role_info)
              
              # Check if analysis returned an error
              if 'error' in analysis:
@@ -3645,42 +3645,10 @@ class ResumeApp:
              # Show snowflake effect
              st.snow()
      
-             # Save resume data to database
-             resume_data = {
-                 'personal_info': {
-                     'name': analysis.get('name', ''),
-                     'email': analysis.get('email', ''),
-                     'phone': analysis.get('phone', ''),
-                     'linkedin': analysis.get('linkedin', ''),
-                     'github': analysis.get('github', ''),
-                     'portfolio': analysis.get('portfolio', '')
-                 },
-                 'summary': analysis.get('summary', ''),
-                 'target_role': selected_role,
-                 'target_category': selected_category,
-                 'education': analysis.get('education', []),
-                 'experience': analysis.get('experience', []),
-                 'projects': analysis.get('projects', []),
-                 'skills': analysis.get('skills', []),
-                 'template': ''
-             }
-     
-             # Save to database
+             # Save resume and analysis in the background so results render without waiting on disk
              try:
-                 resume_id = save_resume_data(resume_data)
-     
-                 # Save analysis data
-                 analysis_data = {
-                     'resume_id': resume_id,
-                     'ats_score': analysis['ats_score'],
-                     'keyword_match_score': analysis['keyword_match']['score'],
-                     'format_score': analysis['format_score'],
-                     'section_score': analysis['section_score'],
-                     'missing_skills': ','.join(analysis['keyword_match']['missing_skills']),
-                     'recommendations': ','.join(analysis['suggestions'])
-                 }
-                 save_analysis_data(resume_id, analysis_data)
-                 st.success("Resume data saved successfully!")
+                 resume_data, analysis_data = self._build_analysis_records(analysis, selected_role, selected_category)
+                 self._track_save(queue_resume_with_analysis(resume_data, analysis_data))
              except Exception as e:
                  st.error(f"Error saving to database: {str(e)}")
                  print(f"Database error: {e}")
@@ -3700,56 +3668,39 @@ class ResumeApp:
     def _analyze_multiple_resumes(self, uploaded_files, role_info, selected_role, selected_category):
          """Analyze multiple resumes and compare them"""
          with st.spinner(f"Analyzing {len(uploaded_files)} resumes... This may take a moment."):
-             resume_analyses = []
-             
              progress_bar = st.progress(0)
              status_text = st.empty()
              
-             for i, uploaded_file in enumerate(uploaded_files):
-                 status_text.text(f"Analyzing {uploaded_file.name}... ({i+1}/{len(uploaded_files)})")
-                 progress_bar.progress((i + 1) / len(uploaded_files))
+             # Extraction and analysis run in worker processes; results stream back as each file finishes
+             analyzed = []
+             for done, result in enumerate(self.batch_analyzer.analyze(uploaded_files, role_info), start=1):
+                 uploaded_file = result['uploaded_file']
+                 status_text.text(f"Analyzed {uploaded_file.name}... ({done}/{len(uploaded_files)})")
+                 progress_bar.progress(done / len(uploaded_files))
                  
-                 # Extract text from file
-                 text = ""
-                 try:
-                     if uploaded_file.type == "application/pdf":
-                         try:
-                             text = self.analyzer.extract_text_from_pdf(uploaded_file)
-                         except Exception:
-                             try:
-                                 text = self.ai_analyzer.extract_text_from_pdf(uploaded_file)
-                             except Exception as e:
-                                 st.warning(f"Failed to extract text from {uploaded_file.name}: {str(e)}")
-                                 continue
-                     elif uploaded_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-                         try:
-                             text = self.analyzer.extract_text_from_docx(uploaded_file)
-                         except Exception:
-                             try:
-                                 text = self.ai_analyzer.extract_text_from_docx(uploaded_file)
-                             except Exception as e:
-                                 st.warning(f"Failed to extract text from {uploaded_file.name}: {str(e)}")
-                                 continue
-                     else:
-                         text = uploaded_file.getvalue().decode()
-                         
-                     if not text or text.strip() == "":
-                         st.warning(f"Could not extract text from {uploaded_file.name}")
-                         continue
-                         
-                 except Exception as e:
-                     st.warning(f"Error reading {uploaded_file.name}: {str(e)}")
+                 analysis = result['analysis']
+                 if result['status'] == 'extract_failed':
+                     st.warning(f"Failed to extract text from {uploaded_file.name}: {result['error']}")
+                     continue
+                 elif result['status'] == 'empty':
+                     st.warning(f"Could not extract text from {uploaded_file.name}")
                      continue
-                 
-                 # Analyze the resume
-                 analysis = self.analyzer.analyze_resume({'raw_text': text}, role_info)
                  
                  if 'error' not in analysis and analysis.get('document_type') == 'resume':
                      analysis['filename'] = uploaded_file.name
-                     resume_analyses.append(analysis)
+                     analyzed.append((result['index'], analysis))
                  else:
                      st.warning(f"{uploaded_file.name} appears to be invalid or not a resume")
              
+             # Keep upload order regardless of which worker finished first
+             resume_analyses = [analysis for _, analysis in sorted(analyzed, key=lambda item: item[0])]
+             
+             # Persist every analyzed resume in the background; the writer group-commits them
+             if resume_analyses:
+                 records = [self._build_analysis_records(analysis, selected_role, selected_category)
+                            for analysis in resume_analyses]
+                 self._track_save(queue_resumes_with_analyses(records), f"Saved {len(records)} resumes!")
+             
              status_text.empty()
              progress_bar.empty()
              
@@ -4951,6 +4902,9 @@ class ResumeApp:
                 self.render_home()
         else:
             self.render_home()
+
+        # Report background saves after the page, so rendering never waits on them
+        self._report_pending_saves()
         
         # Add footer
         self.add_footer()
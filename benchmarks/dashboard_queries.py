@@ -0,0 +1,168 @@
+"""
+Time the admin dashboard queries on a synthetic database, before and after
+the schema migrations in config/database.py.
+
+    python -m benchmarks.dashboard_queries --rows 100000
+
+The database is built in a temporary directory at migration version 1 (the
+original tables, no indexes) and seeded. The DashboardManager of the
+baseline commit, loaded with git show, is timed on it, then it is migrated to
+the latest version and the current DashboardManager is timed, both with its
+query cache cleared before every run and served from the cache. Nothing
+touches resume_data.db.
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import subprocess
+import tempfile
+import time
+import types
+from datetime import datetime, timedelta
+
+from config.database import CONNECTION_PRAGMAS, categorize_skill, migrate
+from dashboard.dashboard import DashboardManager
+from dashboard.query_cache import get_query_cache
+
+# Commit whose dashboard queries (recursive skill splits, per-period and
+# per-day scans, no rollups) are the baseline
+BASELINE_REVISION = '52e19faeb8bd6fa09adf6ca0f07dcdc67c67876e'
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CATEGORIES = ['Software Development', 'Data Science', 'Cloud & DevOps', 'Design', 'Management', None]
+SKILLS = ['Python', 'Java', 'JavaScript', 'SQL', 'MongoDB', 'AWS', 'Azure', 'Agile', 'Scrum',
+          'React', 'Docker', 'Kubernetes', 'C++', 'Excel', 'Communication', 'Leadership']
+
+DASHBOARD_QUERIES = [
+    'get_resume_metrics',
+    'get_skill_distribution',
+    'get_weekly_trends',
+    'get_job_category_stats',
+    'get_trend_indicators',
+    'get_detailed_insights',
+    'get_quick_stats',
+    'get_database_stats',
+    'get_resume_data',
+    'get_admin_logs'
+]
+
+
+def seed(conn, rows, days=365, seed_value=42):
+    """Insert ``rows`` resumes with one analysis each, spread over the last ``days`` days"""
+    rng = random.Random(seed_value)
+    now = datetime.now()
+
+    def timestamp():
+        return (now - timedelta(seconds=rng.randrange(days * 86400))).strftime('%Y-%m-%d %H:%M:%S')
+
+    # Rows arrive in time order in production, so ids and created_at rise together
+    timestamps = sorted(timestamp() for _ in range(rows))
+    resumes = []
+    skills = []
+    analyses = []
+    for resume_id, created_at in enumerate(timestamps, start=1):
+        resume_skills = rng.sample(SKILLS, rng.randint(2, 8))
+        resumes.append((
+            resume_id, f'Candidate {resume_id}', f'candidate{resume_id}@example.com', '5550000000',
+            'Software Engineer', rng.choice(CATEGORIES), str(resume_skills), created_at
+        ))
+        # The save path writes normalized skills alongside each resume
+        skills.extend((resume_id, skill, categorize_skill(skill), created_at) for skill in resume_skills)
+        analyses.append((
+            resume_id, rng.uniform(20, 100), rng.uniform(10, 100), rng.uniform(30, 100),
+            rng.uniform(30, 100), created_at
+        ))
+
+    conn.executemany('''
+        INSERT INTO resume_data (id, name, email, phone, target_role, target_category, skills, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ''', resumes)
+    conn.executemany(
+        'INSERT INTO resume_skills (resume_id, skill_name, skill_category, created_at) VALUES (?, ?, ?, ?)',
+        skills
+    )
+    conn.executemany('''
+        INSERT INTO resume_analysis (resume_id, ats_score, keyword_match_score, format_score, section_score, created_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+    ''', analyses)
+    conn.executemany(
+        'INSERT INTO admin_logs (admin_email, action, timestamp) VALUES (?, ?, ?)',
+        [('admin@example.com', rng.choice(['login', 'logout']), created_at)
+         for created_at in sorted(timestamp() for _ in range(max(rows // 10, 1)))]
+    )
+    conn.commit()
+
+
+def load_baseline_dashboard(conn, revision=BASELINE_REVISION):
+    """Return the DashboardManager of ``revision``, running its queries on ``conn``"""
+    path = f'{revision[:7]}:dashboard/dashboard.py'
+    source = subprocess.run(
+        ['git', 'show', f'{revision}:dashboard/dashboard.py'],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    module = types.ModuleType('baseline_dashboard')
+    module.__file__ = path
+    exec(compile(source, path, 'exec'), module.__dict__)
+
+    # Its __init__ opens resume_data.db; only the connection is needed
+    dashboard = module.DashboardManager.__new__(module.DashboardManager)
+    dashboard.conn = conn
+    return dashboard
+
+
+def time_queries(dashboard, repeat, cold=True):
+    """Return {method name: best wall time in milliseconds over ``repeat`` runs}.
+
+    With ``cold`` the dashboard query cache is emptied before every run.
+    """
+    timings = {}
+    for name in DASHBOARD_QUERIES:
+        method = getattr(dashboard, name)
+        best = float('inf')
+        for _ in range(repeat):
+            if cold:
+                get_query_cache().clear()
+            started = time.perf_counter()
+            method()
+            best = min(best, time.perf_counter() - started)
+        timings[name] = best * 1000
+    return timings
+
+
+def run(rows, repeat):
+    with tempfile.TemporaryDirectory() as directory:
+        conn = sqlite3.connect(os.path.join(directory, 'benchmark.db'))
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        migrate(conn, target_version=1)
+
+        print(f"Seeding {rows:,} resumes...")
+        seed(conn, rows)
+
+        before = time_queries(load_baseline_dashboard(conn), repeat)
+        started = time.perf_counter()
+        version = migrate(conn)
+        migration_seconds = time.perf_counter() - started
+        after = time_queries(DashboardManager(conn), repeat)
+        cached = time_queries(DashboardManager(conn), repeat, cold=False)
+        conn.close()
+
+    print(f"Migrated to version {version} in {migration_seconds:.2f}s\n")
+    print(f"{'query':<26}{'baseline (ms)':>14}{f'v{version} (ms)':>12}{'speedup':>10}{'cached (ms)':>14}")
+    for name in DASHBOARD_QUERIES:
+        speedup = before[name] / after[name] if after[name] else float('inf')
+        print(f"{name:<26}{before[name]:>14.2f}{after[name]:>12.2f}{speedup:>9.1f}x{cached[name]:>14.3f}")
+    total_before = sum(before.values())
+    total_after = sum(after.values())
+    total_cached = sum(cached.values())
+    print(f"{'total':<26}{total_before:>14.2f}{total_after:>12.2f}{total_before / total_after:>9.1f}x{total_cached:>14.3f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100000, help='number of resumes to seed')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per query; the best is reported')
+    args = parser.parse_args()
+    run(args.rows, args.repeat)
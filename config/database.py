@@ -1,16 +1,121 @@
+import ast
+import atexit
+import queue
 import sqlite3
+import threading
+import time
+from concurrent.futures import Future
 from datetime import datetime
 
+DB_PATH = 'resume_data.db'
+
+# Idle connections kept open for reuse; extra ones are closed when released
+MAX_IDLE_CONNECTIONS = 8
+
+# Dashboard skill buckets, checked in order; a skill lands in the first
+# bucket with a fragment it contains, otherwise in 'Other'
+SKILL_CATEGORY_FRAGMENTS = [
+    ('Programming', ('python', 'java', 'javascript', 'c++', 'programming')),
+    ('Database', ('sql', 'database', 'mongodb')),
+    ('Cloud', ('aws', 'cloud', 'azure')),
+    ('Management', ('agile', 'scrum', 'management'))
+]
+
+# Tables whose writes bump data_version, which invalidates cached dashboard results
+DATA_VERSION_TABLES = ['resume_data', 'resume_analysis', 'resume_skills', 'admin_logs']
+
+# Resumes handled per batch by the resume_skills backfill
+SKILL_BACKFILL_BATCH = 1000
+
+# Applied once to every new connection
+CONNECTION_PRAGMAS = [
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-8000'
+]
+
+
+class PooledConnection(sqlite3.Connection):
+    """SQLite connection whose close() hands it back to its pool instead of closing it"""
+
+    def close(self):
+        pool = getattr(self, '_pool', None)
+        if pool is None:
+            super().close()
+        else:
+            pool.release(self)
+
+    def close_for_real(self):
+        super().close()
+
+
+class ConnectionPool:
+    """Thread-safe pool of configured SQLite connections to one database file"""
+
+    def __init__(self, db_path, max_idle=MAX_IDLE_CONNECTIONS):
+        self.db_path = db_path
+        self.max_idle = max_idle
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        # Connections move between Streamlit script threads, but only one uses each at a time
+        conn = sqlite3.connect(self.db_path, timeout=5, check_same_thread=False, factory=PooledConnection)
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        conn._pool = self
+        return conn
+
+    def acquire(self):
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self._connect()
+
+    def release(self, conn):
+        # Never hand out a connection with a half-finished transaction
+        if conn.in_transaction:
+            conn.rollback()
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.close_for_real()
+
+    def close_all(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close_for_real()
+
+
+_pool = ConnectionPool(DB_PATH)
+_schema_ready = False
+_schema_lock = threading.Lock()
+
 def get_database_connection():
-    """Create and return a database connection"""
-    conn = sqlite3.connect('resume_data.db')
-    return conn
+    """Return a pooled database connection; call close() on it to give it back"""
+    return _pool.acquire()
 
 def init_database():
-    """Initialize database tables"""
+    """Initialize database tables (once per process)"""
+    global _schema_ready
+    with _schema_lock:
+        if _schema_ready:
+            return
+        _create_schema()
+        _schema_ready = True
+
+def _create_schema():
     conn = get_database_connection()
-    cursor = conn.cursor()
-    
+    try:
+        migrate(conn)
+    finally:
+        conn.close()
+
+def _create_base_tables(cursor):
+    """Create the original tables (a no-op on databases that predate migrations)"""
     # Create resume_data table
     cursor.execute('''
     CREATE TABLE IF NOT EXISTS resume_data (
@@ -81,9 +186,337 @@ def init_database():
         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
     )
     ''')
+
+def _migrate_resume_skills(cursor):
+    """Index resume_skills and fill it from the stringified resume_data.skills column"""
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_resume_skills_resume_id ON resume_skills (resume_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_resume_skills_category ON resume_skills (skill_category)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_resume_skills_name ON resume_skills (skill_name COLLATE NOCASE)')
+    last_id = 0
+    while last_id is not None:
+        last_id, _ = _backfill_skills_batch(cursor, last_id, SKILL_BACKFILL_BATCH)
+
+def _migrate_daily_stats(cursor):
+    """Create the per-day, per-category dashboard rollup and the triggers that maintain it"""
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS resume_daily_stats (
+        day TEXT NOT NULL,
+        category TEXT NOT NULL,
+        resumes INTEGER NOT NULL DEFAULT 0,
+        analyses INTEGER NOT NULL DEFAULT 0,
+        ats_sum REAL NOT NULL DEFAULT 0,
+        ats_count INTEGER NOT NULL DEFAULT 0,
+        keyword_sum REAL NOT NULL DEFAULT 0,
+        keyword_count INTEGER NOT NULL DEFAULT 0,
+        high_scoring INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (day, category)
+    ) WITHOUT ROWID
+    ''')
+    
+    # A resume counts on the day it was created; its analyses count on their own
+    # created_at day, under the resume's category ('' when it has none)
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS trg_resume_data_daily_stats
+    AFTER INSERT ON resume_data
+    BEGIN
+        INSERT INTO resume_daily_stats (day, category, resumes)
+        VALUES (COALESCE(DATE(NEW.created_at), DATE('now')), COALESCE(NEW.target_category, ''), 1)
+        ON CONFLICT (day, category) DO UPDATE SET resumes = resumes + 1;
+    END
+    ''')
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS trg_resume_analysis_daily_stats
+    AFTER INSERT ON resume_analysis
+    BEGIN
+        INSERT INTO resume_daily_stats (
+            day, category, analyses, ats_sum, ats_count,
+            keyword_sum, keyword_count, high_scoring
+        ) VALUES (
+            COALESCE(DATE(NEW.created_at), DATE('now')),
+            COALESCE((SELECT target_category FROM resume_data WHERE id = NEW.resume_id), ''),
+            1,
+            COALESCE(NEW.ats_score, 0),
+            NEW.ats_score IS NOT NULL,
+            COALESCE(NEW.keyword_match_score, 0),
+            NEW.keyword_match_score IS NOT NULL,
+            COALESCE(NEW.ats_score >= 70, 0)
+        )
+        ON CONFLICT (day, category) DO UPDATE SET
+            analyses = analyses + excluded.analyses,
+            ats_sum = ats_sum + excluded.ats_sum,
+            ats_count = ats_count + excluded.ats_count,
+            keyword_sum = keyword_sum + excluded.keyword_sum,
+            keyword_count = keyword_count + excluded.keyword_count,
+            high_scoring = high_scoring + excluded.high_scoring;
+    END
+    ''')
+    _rebuild_daily_stats(cursor)
+
+def _rebuild_daily_stats(cursor):
+    """Recompute resume_daily_stats from resume_data and resume_analysis"""
+    cursor.execute('DELETE FROM resume_daily_stats')
+    cursor.execute('''
+    INSERT INTO resume_daily_stats (day, category, resumes)
+    SELECT COALESCE(DATE(created_at), DATE('now')), COALESCE(target_category, ''), COUNT(*)
+    FROM resume_data
+    GROUP BY 1, 2
+    ''')
+    cursor.execute('''
+    INSERT INTO resume_daily_stats (
+        day, category, analyses, ats_sum, ats_count,
+        keyword_sum, keyword_count, high_scoring
+    )
+    SELECT
+        COALESCE(DATE(ra.created_at), DATE('now')),
+        COALESCE(rd.target_category, ''),
+        COUNT(*),
+        TOTAL(ra.ats_score),
+        COUNT(ra.ats_score),
+        TOTAL(ra.keyword_match_score),
+        COUNT(ra.keyword_match_score),
+        COUNT(CASE WHEN ra.ats_score >= 70 THEN 1 END)
+    FROM resume_analysis ra
+    LEFT JOIN resume_data rd ON rd.id = ra.resume_id
+    WHERE true
+    GROUP BY 1, 2
+    ON CONFLICT (day, category) DO UPDATE SET
+        analyses = excluded.analyses,
+        ats_sum = excluded.ats_sum,
+        ats_count = excluded.ats_count,
+        keyword_sum = excluded.keyword_sum,
+        keyword_count = excluded.keyword_count,
+        high_scoring = excluded.high_scoring
+    ''')
+
+def rebuild_dashboard_stats():
+    """Recompute the dashboard rollup from scratch, e.g. after rows were edited or deleted by hand"""
+    conn = get_database_connection()
+    cursor = conn.cursor()
+    
+    try:
+        _rebuild_daily_stats(cursor)
+        # The rollup has no triggers of its own, so invalidate cached dashboard results here
+        cursor.execute('UPDATE data_version SET version = version + 1 WHERE id = 1')
+        conn.commit()
+        return True
+    except Exception as e:
+        print(f"Error rebuilding dashboard stats: {str(e)}")
+        conn.rollback()
+        return False
+    finally:
+        conn.close()
+
+def _migrate_data_version(cursor):
+    """Create the single-row write counter and the triggers that bump it"""
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS data_version (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        version INTEGER NOT NULL
+    )
+    ''')
+    cursor.execute('INSERT OR IGNORE INTO data_version (id, version) VALUES (1, 0)')
+    for table in DATA_VERSION_TABLES:
+        for event in ('INSERT', 'UPDATE', 'DELETE'):
+            cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_{event.lower()}_data_version
+            AFTER {event} ON {table}
+            BEGIN
+                UPDATE data_version SET version = version + 1 WHERE id = 1;
+            END
+            ''')
+
+def get_data_version(conn):
+    """Return the counter bumped by every write to DATA_VERSION_TABLES, or None if it does not exist yet"""
+    try:
+        row = conn.execute('SELECT version FROM data_version WHERE id = 1').fetchone()
+    except sqlite3.Error:
+        return None
+    return row[0] if row else None
+
+# Schema changes, applied in order by migrate(); the database's PRAGMA
+# user_version records the last one applied. Each entry is
+# (version, description, step) where step is a list of SQL statements or a
+# function taking a cursor. Append new entries; never edit applied ones.
+MIGRATIONS = [
+    (1, 'base tables', _create_base_tables),
+    (2, 'dashboard and admin log indexes', [
+        'CREATE INDEX IF NOT EXISTS idx_resume_analysis_resume_id ON resume_analysis (resume_id)',
+        # Covers the before/after-last-week ATS averages without touching the table
+        'CREATE INDEX IF NOT EXISTS idx_resume_analysis_created_at ON resume_analysis (created_at, ats_score)',
+        'CREATE INDEX IF NOT EXISTS idx_resume_data_created_at ON resume_data (created_at)',
+        'CREATE INDEX IF NOT EXISTS idx_resume_data_target_category ON resume_data (target_category)',
+        'CREATE INDEX IF NOT EXISTS idx_admin_logs_timestamp ON admin_logs (timestamp)',
+        'ANALYZE'
+    ]),
+    (3, 'normalized resume skills', _migrate_resume_skills),
+    (4, 'dashboard daily rollup', _migrate_daily_stats),
+    (5, 'data version counter', _migrate_data_version)
+]
+
+def get_schema_version(conn):
+    """Return the last migration version applied to this database"""
+    return conn.execute('PRAGMA user_version').fetchone()[0]
+
+def migrate(conn, target_version=None):
+    """Apply pending migrations up to target_version (default: latest).
+
+    Each migration runs in its own transaction together with the
+    user_version bump, so a failed step leaves the database at the
+    previous version. Returns the resulting schema version.
+    """
+    current = get_schema_version(conn)
+    for version, description, step in MIGRATIONS:
+        if version <= current or (target_version is not None and version > target_version):
+            continue
+        cursor = conn.cursor()
+        try:
+            cursor.execute('BEGIN')
+            if callable(step):
+                step(cursor)
+            else:
+                for statement in step:
+                    cursor.execute(statement)
+            cursor.execute(f'PRAGMA user_version = {int(version)}')
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            print(f"Error applying migration {version} ({description}): {str(e)}")
+            raise
+        current = version
+    return current
+
+def _insert_resume(cursor, data):
+    """Insert one resume_data row and return its id"""
+    personal_info = data.get('personal_info', {})
+    
+    cursor.execute('''
+    INSERT INTO resume_data (
+        name, email, phone, linkedin, github, portfolio,
+        summary, target_role, target_category, education, 
+        experience, projects, skills, template
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', (
+        personal_info.get('full_name', ''),
+        personal_info.get('email', ''),
+        personal_info.get('phone', ''),
+        personal_info.get('linkedin', ''),
+        personal_info.get('github', ''),
+        personal_info.get('portfolio', ''),
+        data.get('summary', ''),
+        data.get('target_role', ''),
+        data.get('target_category', ''),
+        str(data.get('education', [])),
+        str(data.get('experience', [])),
+        str(data.get('projects', [])),
+        str(data.get('skills', [])),
+        data.get('template', '')
+    ))
+    resume_id = cursor.lastrowid
+    _insert_skills(cursor, resume_id, data.get('skills', []))
+    return resume_id
+
+def categorize_skill(skill_name):
+    """Return the dashboard bucket (Programming, Database, Cloud, Management or Other) for a skill"""
+    lowered = skill_name.lower()
+    for category, fragments in SKILL_CATEGORY_FRAGMENTS:
+        if any(fragment in lowered for fragment in fragments):
+            return category
+    return 'Other'
+
+def normalize_skills(skills):
+    """Return unique skill names from a list, a {category: [skills]} dict, or the str() of either.
+
+    Names are stripped and de-duplicated case-insensitively, keeping the
+    first spelling seen.
+    """
+    if isinstance(skills, str):
+        text = skills.strip()
+        try:
+            skills = ast.literal_eval(text) if text else []
+        except (ValueError, SyntaxError):
+            skills = [part.strip('[]"\' ') for part in text.split(',')]
+    if isinstance(skills, dict):
+        skills = [skill for group in skills.values()
+                  for skill in ([group] if isinstance(group, str) else group or [])]
+    if not isinstance(skills, (list, tuple, set)):
+        return []
+
+    names = {}
+    for skill in skills:
+        name = ' '.join(str(skill).split())
+        if name and name.lower() not in names:
+            names[name.lower()] = name
+    return list(names.values())
+
+def _insert_skills(cursor, resume_id, skills):
+    """Insert one resume_skills row per normalized skill"""
+    rows = [(resume_id, name, categorize_skill(name)) for name in normalize_skills(skills)]
+    if rows:
+        cursor.executemany(
+            'INSERT INTO resume_skills (resume_id, skill_name, skill_category) VALUES (?, ?, ?)', rows
+        )
+
+def _backfill_skills_batch(cursor, after_id, batch_size):
+    """Fill resume_skills for the next batch of resumes that have none.
+
+    Returns (last resume id handled, resumes handled); the id is None
+    when nothing is left.
+    """
+    rows = cursor.execute('''
+    SELECT id, skills FROM resume_data
+    WHERE id > ? AND skills IS NOT NULL
+    AND NOT EXISTS (SELECT 1 FROM resume_skills s WHERE s.resume_id = resume_data.id)
+    ORDER BY id
+    LIMIT ?
+    ''', (after_id, batch_size)).fetchall()
+    if not rows:
+        return None, 0
+    for resume_id, skills in rows:
+        _insert_skills(cursor, resume_id, skills)
+    return rows[-1][0], len(rows)
+
+def backfill_resume_skills(batch_size=SKILL_BACKFILL_BATCH):
+    """Fill resume_skills for resumes saved before skills were normalized.
+
+    Commits after every batch, so it can be interrupted and run again.
+    Returns the number of resumes processed.
+    """
+    conn = get_database_connection()
+    cursor = conn.cursor()
+    processed = 0
     
-    conn.commit()
-    conn.close()
+    try:
+        last_id = 0
+        while True:
+            last_id, handled = _backfill_skills_batch(cursor, last_id, batch_size)
+            if last_id is None:
+                return processed
+            conn.commit()
+            processed += handled
+    except Exception as e:
+        print(f"Error backfilling resume skills: {str(e)}")
+        conn.rollback()
+        return processed
+    finally:
+        conn.close()
+
+def _insert_analysis(cursor, resume_id, analysis):
+    """Insert one resume_analysis row for resume_id"""
+    cursor.execute('''
+    INSERT INTO resume_analysis (
+        resume_id, ats_score, keyword_match_score,
+        format_score, section_score, missing_skills,
+        recommendations
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', (
+        resume_id,
+        float(analysis.get('ats_score', 0)),
+        float(analysis.get('keyword_match_score', 0)),
+        float(analysis.get('format_score', 0)),
+        float(analysis.get('section_score', 0)),
+        analysis.get('missing_skills', ''),
+        analysis.get('recommendations', '')
+    ))
 
 def save_resume_data(data):
     """Save resume data to database"""
@@ -91,33 +524,9 @@ def save_resume_data(data):
     cursor = conn.cursor()
     
     try:
-        personal_info = data.get('personal_info', {})
-        
-        cursor.execute('''
-        INSERT INTO resume_data (
-            name, email, phone, linkedin, github, portfolio,
-            summary, target_role, target_category, education, 
-            experience, projects, skills, template
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            personal_info.get('full_name', ''),
-            personal_info.get('email', ''),
-            personal_info.get('phone', ''),
-            personal_info.get('linkedin', ''),
-            personal_info.get('github', ''),
-            personal_info.get('portfolio', ''),
-            data.get('summary', ''),
-            data.get('target_role', ''),
-            data.get('target_category', ''),
-            str(data.get('education', [])),
-            str(data.get('experience', [])),
-            str(data.get('projects', [])),
-            str(data.get('skills', [])),
-            data.get('template', '')
-        ))
-        
+        resume_id = _insert_resume(cursor, data)
         conn.commit()
-        return cursor.lastrowid
+        return resume_id
     except Exception as e:
         print(f"Error saving resume data: {str(e)}")
         conn.rollback()
@@ -131,22 +540,7 @@ def save_analysis_data(resume_id, analysis):
     cursor = conn.cursor()
     
     try:
-        cursor.execute('''
-        INSERT INTO resume_analysis (
-            resume_id, ats_score, keyword_match_score,
-            format_score, section_score, missing_skills,
-            recommendations
-        ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            resume_id,
-            float(analysis.get('ats_score', 0)),
-            float(analysis.get('keyword_match_score', 0)),
-            float(analysis.get('format_score', 0)),
-            float(analysis.get('section_score', 0)),
-            analysis.get('missing_skills', ''),
-            analysis.get('recommendations', '')
-        ))
-        
+        _insert_analysis(cursor, resume_id, analysis)
         conn.commit()
     except Exception as e:
         print(f"Error saving analysis data: {str(e)}")
@@ -154,6 +548,187 @@ def save_analysis_data(resume_id, analysis):
     finally:
         conn.close()
 
+def save_resume_with_analysis(data, analysis):
+    """Save a resume and its analysis in one transaction; returns the resume id or None"""
+    ids = save_resumes_with_analyses([(data, analysis)])
+    return ids[0] if ids else None
+
+def save_resumes_with_analyses(records):
+    """Save (resume data, analysis) pairs with a single commit.
+
+    Either every pair is written or, on error, none are. Returns the new
+    resume ids in input order, or an empty list on failure.
+    """
+    conn = get_database_connection()
+    cursor = conn.cursor()
+    
+    try:
+        resume_ids = []
+        for data, analysis in records:
+            resume_id = _insert_resume(cursor, data)
+            _insert_analysis(cursor, resume_id, analysis)
+            resume_ids.append(resume_id)
+        conn.commit()
+        return resume_ids
+    except Exception as e:
+        print(f"Error saving resume and analysis data: {str(e)}")
+        conn.rollback()
+        return []
+    finally:
+        conn.close()
+
+class WriteBehindQueue:
+    """Background writer that group-commits queued inserts.
+
+    Writes are handed to a daemon thread. A write that arrives while the
+    queue is idle is committed at once; when others are already waiting
+    they are committed together in batches of up to ``max_batch``, waiting
+    up to ``max_delay`` seconds for more to group. A batch that hits "database is locked" is retried with
+    backoff; a batch that fails for any other reason is replayed one
+    write per transaction (each again retried while locked) so a single
+    bad write cannot drop the rest. Every submitted write gets a Future
+    that resolves once it is committed, or to the exception that lost it.
+    Pending writes are flushed at interpreter exit.
+    """
+
+    def __init__(self, max_batch=50, max_delay=0.5, max_retries=5):
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.max_retries = max_retries
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._stopping = False
+
+    def submit(self, write, *args):
+        """Queue ``write(cursor, *args)`` to run in a later group commit; returns its Future"""
+        future = Future()
+        self._ensure_started()
+        self._queue.put((write, args, future))
+        return future
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stopping = False
+                self._thread = threading.Thread(target=self._run, name='db-write-behind', daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            stop = False
+            # Take whatever is already waiting without blocking
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            # Only wait for more writes to group when writes are arriving
+            # together; a lone write on an idle queue is committed now
+            deadline = time.monotonic() + self.max_delay
+            while len(batch) > 1 and not stop and len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._commit_batch(batch)
+            if stop:
+                return
+
+    def _write_with_retry(self, batch):
+        """Commit batch, retrying with backoff while the database is locked"""
+        for attempt in range(self.max_retries):
+            try:
+                self._write(batch)
+                return
+            except sqlite3.OperationalError as e:
+                if ('locked' not in str(e) and 'busy' not in str(e)) or attempt == self.max_retries - 1:
+                    raise
+                time.sleep(0.05 * (2 ** attempt))
+
+    def _commit_batch(self, batch):
+        try:
+            self._write_with_retry(batch)
+            for _, _, future in batch:
+                future.set_result(True)
+            return
+        except Exception:
+            pass
+
+        # Isolate the failing write(s) by committing one at a time
+        for item in batch:
+            try:
+                self._write_with_retry([item])
+                item[2].set_result(True)
+            except Exception as e:
+                print(f"Error in background database write: {str(e)}")
+                item[2].set_exception(e)
+
+    def _write(self, batch):
+        conn = get_database_connection()
+        try:
+            cursor = conn.cursor()
+            for write, args, _ in batch:
+                write(cursor, *args)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def shutdown(self):
+        """Flush pending writes and stop the writer thread"""
+        with self._lock:
+            thread = self._thread
+            if thread is None or not thread.is_alive() or self._stopping:
+                return
+            self._stopping = True
+        self._queue.put(None)
+        thread.join()
+
+
+_write_queue = WriteBehindQueue()
+atexit.register(_write_queue.shutdown)
+
+def _insert_resume_with_analysis(cursor, data, analysis):
+    resume_id = _insert_resume(cursor, data)
+    _insert_analysis(cursor, resume_id, analysis)
+
+def _insert_resumes_with_analyses(cursor, records):
+    for data, analysis in records:
+        _insert_resume_with_analysis(cursor, data, analysis)
+
+def queue_resume_data(data):
+    """Save resume data in the background; returns a Future that resolves once committed"""
+    return _write_queue.submit(_insert_resume, data)
+
+def queue_resume_with_analysis(data, analysis):
+    """Save a resume and its analysis together in the background; returns its Future"""
+    return _write_queue.submit(_insert_resume_with_analysis, data, analysis)
+
+def queue_resumes_with_analyses(records):
+    """Save (resume data, analysis) pairs in the background as one write, so
+    either every pair is committed or none is; returns its Future"""
+    return _write_queue.submit(_insert_resumes_with_analyses, list(records))
+
 def get_resume_stats():
     """Get statistics about resumes"""
     conn = get_database_connection()
@@ -286,39 +861,43 @@ def add_admin(email, password):
     finally:
         conn.close()
 
+def _insert_ai_analysis(cursor, resume_id, analysis_data):
+    """Insert one ai_analysis row, creating the table on first use"""
+    # Check if the ai_analysis table exists
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS ai_analysis (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            resume_id INTEGER,
+            model_used TEXT,
+            resume_score INTEGER,
+            job_role TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (resume_id) REFERENCES resume_data (id)
+        )
+    """)
+    
+    # Insert the analysis data
+    cursor.execute("""
+        INSERT INTO ai_analysis (
+            resume_id, model_used, resume_score, job_role
+        ) VALUES (?, ?, ?, ?)
+    """, (
+        resume_id,
+        analysis_data.get('model_used', ''),
+        analysis_data.get('resume_score', 0),
+        analysis_data.get('job_role', '')
+    ))
+    return cursor.lastrowid
+
 def save_ai_analysis_data(resume_id, analysis_data):
     """Save AI analysis data to the database"""
     conn = get_database_connection()
     cursor = conn.cursor()
     
     try:
-        # Check if the ai_analysis table exists
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS ai_analysis (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                resume_id INTEGER,
-                model_used TEXT,
-                resume_score INTEGER,
-                job_role TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (resume_id) REFERENCES resume_data (id)
-            )
-        """)
-        
-        # Insert the analysis data
-        cursor.execute("""
-            INSERT INTO ai_analysis (
-                resume_id, model_used, resume_score, job_role
-            ) VALUES (?, ?, ?, ?)
-        """, (
-            resume_id,
-            analysis_data.get('model_used', ''),
-            analysis_data.get('resume_score', 0),
-            analysis_data.get('job_role', '')
-        ))
-        
+        analysis_id = _insert_ai_analysis(cursor, resume_id, analysis_data)
         conn.commit()
-        return cursor.lastrowid
+        return analysis_id
     except Exception as e:
         print(f"Error saving AI analysis data: {e}")
         conn.rollback()
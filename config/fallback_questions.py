@@ -1,9 +1,11 @@
 # fallback_questions.py
 
-def create_fallback_questions(num_questions, topic, difficulty):
-    """Create fallback questions when AI generation fails"""
+import random
+from types import MappingProxyType
 
-    fallback_banks = {
+# Offline questions per AI practice set, used when Gemini generation fails.
+# Frozen into FALLBACK_BANKS below; edit the questions here.
+_FALLBACK_QUESTIONS = {
         'Practice Set-1': [  # Mixed Aptitude
            {
         "question": "Two cities X and Y are 45 km apart. Two cars start from X and Y in the same direction with speeds of 30 km/hr and 15 km/hr respectively. Both cars meet at point Z beyond Y. Find the distance ZY.",
@@ -1686,13 +1688,36 @@ def create_fallback_questions(num_questions, topic, difficulty):
             
           
     }
-    # Pick the right bank or default to Mixed Aptitude
-    if topic not in fallback_banks:
-        return []  # No fallback, empty if topic doesn't exist
 
-    questions = fallback_banks[topic]
 
-    # Repeat questions if fewer than num_questions
-    result = [questions[i % len(questions)] for i in range(num_questions)]
+def _freeze_question(question):
+    return MappingProxyType(dict(question, options=tuple(question['options'])))
+
+
+# Built once at import: read-only topic -> tuple of read-only questions, shared
+# by every caller instead of being rebuilt per fallback
+FALLBACK_BANKS = MappingProxyType({
+    topic: tuple(_freeze_question(question) for question in questions)
+    for topic, questions in _FALLBACK_QUESTIONS.items()
+})
+del _FALLBACK_QUESTIONS
+
+
+def sample_fallback_questions(num_questions, topic, rng=random):
+    """Return num_questions random questions of a topic as fresh dicts.
+
+    Questions are drawn without replacement and only repeat once the
+    topic's bank has been used up; only the returned questions are copied.
+    """
+    questions = FALLBACK_BANKS.get(topic, ())
+    result = []
+    while questions and len(result) < num_questions:
+        picked = rng.sample(questions, min(num_questions - len(result), len(questions)))
+        result.extend(dict(question, options=list(question['options'])) for question in picked)
     return result
-       
\ No newline at end of file
+
+
+def create_fallback_questions(num_questions, topic, difficulty):
+    """Create fallback questions when AI generation fails"""
+    # Topics without a bank get no fallback questions
+    return sample_fallback_questions(num_questions, topic)
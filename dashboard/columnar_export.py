@@ -0,0 +1,227 @@
+"""
+Incremental, month-partitioned Parquet / Arrow IPC snapshots of the resume,
+analysis, AI analysis and feedback tables for offline analytics.
+
+    python -m dashboard.columnar_export --format parquet --output analytics_snapshots
+
+Each run exports only rows with an id above the table's watermark (kept in
+<output>/_watermarks.json) and writes them under
+<output>/<table>/month=YYYY-MM/, a Hive-style layout that pyarrow.dataset,
+pandas and DuckDB read as one table partitioned by month.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sqlite3
+from datetime import datetime
+
+from config.database import DB_PATH
+from dashboard.export import query_chunks
+
+# FeedbackManager keeps feedback in its own database file
+FEEDBACK_DB_PATH = 'feedback/feedback.db'
+
+SNAPSHOT_DIR = 'analytics_snapshots'
+WATERMARK_FILE = '_watermarks.json'
+SNAPSHOT_CHUNK_ROWS = 5000
+
+# (table, database file, column that decides the month partition)
+SNAPSHOT_TABLES = [
+    ('resume_data', DB_PATH, 'created_at'),
+    ('resume_analysis', DB_PATH, 'created_at'),
+    ('ai_analysis', DB_PATH, 'created_at'),
+    ('feedback', FEEDBACK_DB_PATH, 'timestamp')
+]
+
+FILE_EXTENSIONS = {'parquet': '.parquet', 'arrow': '.arrow'}
+
+
+def _arrow_type(declared_type):
+    """Map a SQLite declared column type to an Arrow type"""
+    import pyarrow as pa
+    declared_type = (declared_type or '').upper()
+    if 'INT' in declared_type or declared_type == 'BOOLEAN':
+        return pa.int64()
+    if 'REAL' in declared_type or 'FLOA' in declared_type or 'DOUB' in declared_type:
+        return pa.float64()
+    if 'TIMESTAMP' in declared_type or 'DATETIME' in declared_type:
+        return pa.timestamp('us')
+    return pa.string()
+
+
+def _parse_timestamp(value):
+    """Parse a stored timestamp; raises ValueError if it is not ISO 8601"""
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(str(value))
+
+
+def load_watermarks(output_dir):
+    path = os.path.join(output_dir, WATERMARK_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_watermarks(output_dir, watermarks):
+    """Write the watermark file atomically, so a crash never leaves it half written"""
+    path = os.path.join(output_dir, WATERMARK_FILE)
+    with open(path + '.tmp', 'w') as f:
+        json.dump(watermarks, f, indent=2)
+    os.replace(path + '.tmp', path)
+
+
+class _MonthWriters:
+    """One open Parquet or Arrow IPC writer per month partition of a table"""
+
+    def __init__(self, table_dir, schema, file_format, file_name):
+        self.table_dir = table_dir
+        self.schema = schema
+        self.file_format = file_format
+        self.file_name = file_name
+        self._writers = {}
+
+    def write(self, month, batch):
+        if month not in self._writers:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            partition_dir = os.path.join(self.table_dir, f'month={month}')
+            os.makedirs(partition_dir, exist_ok=True)
+            temp_path = os.path.join(partition_dir, self.file_name + '.tmp')
+            if self.file_format == 'parquet':
+                writer = pq.ParquetWriter(temp_path, self.schema, compression='zstd')
+            else:
+                writer = pa.ipc.new_file(temp_path, self.schema)
+            self._writers[month] = (writer, temp_path)
+        writer, _ = self._writers[month]
+        writer.write_batch(batch)
+
+    def close(self, publish=True):
+        """Close every writer and move finished files into place (or delete them)"""
+        for writer, temp_path in self._writers.values():
+            writer.close()
+            if publish:
+                os.replace(temp_path, temp_path[:-len('.tmp')])
+            else:
+                os.remove(temp_path)
+        self._writers = {}
+
+
+def export_table(table, db_path, month_column, output_dir, after_id=0, file_format='parquet'):
+    """Export rows of ``table`` with id > after_id; returns (rows written, new watermark id).
+
+    Rows go into one new file per month touched by this run, named after
+    the first id the run could contain, so re-running after a crash before
+    the watermark was saved overwrites the same files instead of duplicating.
+    Raises ValueError, publishing nothing, if any timestamp cannot be parsed,
+    so the watermark never moves past rows that would be exported as NULL.
+    """
+    import pyarrow as pa
+
+    conn = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+    try:
+        columns_info = conn.execute(f'PRAGMA table_info({table})').fetchall()
+        if not columns_info:
+            return 0, after_id
+
+        names = [column[1] for column in columns_info]
+        schema = pa.schema([(column[1], _arrow_type(column[2])) for column in columns_info])
+        timestamp_columns = [i for i, field in enumerate(schema) if pa.types.is_timestamp(field.type)]
+        month_index = names.index(month_column)
+        id_index = names.index('id')
+
+        _, chunks = query_chunks(
+            conn, f'SELECT {", ".join(names)} FROM {table} WHERE id > ? ORDER BY id',
+            (after_id,), SNAPSHOT_CHUNK_ROWS
+        )
+        writers = _MonthWriters(
+            os.path.join(output_dir, table), schema, file_format,
+            f'part-{after_id + 1:010d}{FILE_EXTENSIONS[file_format]}'
+        )
+        written = 0
+        last_id = after_id
+        invalid = []
+        try:
+            for rows in chunks:
+                by_month = {}
+                for row in rows:
+                    month = str(row[month_index])[:7] if row[month_index] else 'unknown'
+                    by_month.setdefault(month, []).append(row)
+                for month, month_rows in by_month.items():
+                    values = [list(column) for column in zip(*month_rows)]
+                    for i in timestamp_columns:
+                        parsed = []
+                        for row_id, value in zip(values[id_index], values[i]):
+                            try:
+                                parsed.append(_parse_timestamp(value))
+                            except ValueError:
+                                parsed.append(None)
+                                invalid.append((row_id, names[i], value))
+                        values[i] = parsed
+                    writers.write(month, pa.record_batch(values, schema=schema))
+                written += len(rows)
+                last_id = rows[-1][id_index]
+            if invalid:
+                examples = ', '.join(f'id {row_id} {column}={value!r}' for row_id, column, value in invalid[:5])
+                raise ValueError(
+                    f"{table}: {len(invalid):,} unparseable timestamp values ({examples}); nothing was exported"
+                )
+        except Exception:
+            writers.close(publish=False)
+            raise
+        writers.close()
+        return written, last_id
+    finally:
+        conn.close()
+
+
+def export_snapshots(output_dir=SNAPSHOT_DIR, file_format='parquet', full=False, tables=SNAPSHOT_TABLES):
+    """Export new rows of every snapshot table and advance their watermarks.
+
+    With ``full`` each table's existing snapshot and watermark are deleted
+    and the table is rebuilt from the first row. Tables or database files that do not exist yet are
+    skipped. Returns {table: rows written}.
+    """
+    if file_format not in FILE_EXTENSIONS:
+        raise ValueError(f"Unknown snapshot format: {file_format}")
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise ImportError("Columnar snapshots need pyarrow: pip install pyarrow")
+
+    os.makedirs(output_dir, exist_ok=True)
+    watermarks = load_watermarks(output_dir)
+    if full:
+        # Saved before exporting, so a rebuild that writes nothing (or fails)
+        # never leaves old watermarks pointing past rows it deleted
+        for table, _, _ in tables:
+            watermarks.pop(table, None)
+        save_watermarks(output_dir, watermarks)
+    summary = {}
+    for table, db_path, month_column in tables:
+        if not os.path.exists(db_path):
+            continue
+        if full:
+            shutil.rmtree(os.path.join(output_dir, table), ignore_errors=True)
+
+        after_id = watermarks.get(table, {}).get('last_id', 0)
+        written, last_id = export_table(table, db_path, month_column, output_dir, after_id, file_format)
+        summary[table] = written
+        if written:
+            watermarks[table] = {'last_id': last_id, 'exported_at': datetime.now().isoformat(timespec='seconds')}
+            save_watermarks(output_dir, watermarks)
+    return summary
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--format', choices=sorted(FILE_EXTENSIONS), default='parquet')
+    parser.add_argument('--output', default=SNAPSHOT_DIR, help='snapshot directory')
+    parser.add_argument('--full', action='store_true', help='discard watermarks and re-export everything')
+    args = parser.parse_args()
+
+    for table, rows in export_snapshots(args.output, args.format, args.full).items():
+        print(f"{table}: {rows:,} new rows")
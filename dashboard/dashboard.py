@@ -2,16 +2,31 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from config.database import get_database_connection
+from dashboard.export import export_csv, export_excel, export_json
+from dashboard.query_cache import cached_query
 import io
 import uuid
 from plotly.subplots import make_subplots
 from io import BytesIO
 
+# Columns shared by the Excel and CSV exports
+RESUME_EXPORT_QUERY = """
+    SELECT 
+        rd.name, rd.email, rd.phone, rd.linkedin, rd.github, rd.portfolio,
+        rd.summary, rd.target_role, rd.target_category,
+        rd.education, rd.experience, rd.projects, rd.skills,
+        ra.ats_score, ra.keyword_match_score, ra.format_score, ra.section_score,
+        ra.missing_skills, ra.recommendations,
+        rd.created_at
+    FROM resume_data rd
+    LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
+"""
+
 class DashboardManager:
-    def __init__(self):
-        self.conn = get_database_connection()
+    def __init__(self, conn=None):
+        self.conn = conn if conn is not None else get_database_connection()
         self.colors = {
             'primary': '#4CAF50',
             'secondary': '#2196F3',
@@ -110,88 +125,54 @@ class DashboardManager:
             </style>
         """, unsafe_allow_html=True)
 
+    @cached_query
     def get_resume_metrics(self):
-        """Get resume-related metrics from database"""
+        """Get resume-related metrics from the daily rollup"""
         cursor = self.conn.cursor()
         
-        # Get current date
-        now = datetime.now()
-        start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        start_of_week = now - timedelta(days=now.weekday())
-        start_of_month = now.replace(day=1)
+        # Periods start at midnight of their first day
+        today = datetime.now().date()
+        periods = [
+            ('Today', today),
+            ('This Week', today - timedelta(days=today.weekday())),
+            ('This Month', today.replace(day=1)),
+            ('All Time', date(2000, 1, 1))
+        ]
+        
+        # One row per day; every period is summed from these
+        cursor.execute("""
+            SELECT day, SUM(resumes), SUM(ats_sum), SUM(ats_count),
+                   SUM(keyword_sum), SUM(keyword_count), SUM(high_scoring)
+            FROM resume_daily_stats
+            GROUP BY day
+        """)
+        daily = cursor.fetchall()
         
-        # Fetch metrics for different time periods
         metrics = {}
-        for period, start_date in [
-            ('Today', start_of_day),
-            ('This Week', start_of_week),
-            ('This Month', start_of_month),
-            ('All Time', datetime(2000, 1, 1))
-        ]:
-            cursor.execute("""
-                SELECT 
-                    COUNT(DISTINCT rd.id) as total_resumes,
-                    ROUND(AVG(ra.ats_score), 1) as avg_ats_score,
-                    ROUND(AVG(ra.keyword_match_score), 1) as avg_keyword_score,
-                    COUNT(DISTINCT CASE WHEN ra.ats_score >= 70 THEN rd.id END) as high_scoring
-                FROM resume_data rd
-                LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-                WHERE rd.created_at >= ?
-            """, (start_date.strftime('%Y-%m-%d %H:%M:%S'),))
-            
-            row = cursor.fetchone()
-            if row:
-                metrics[period] = {
-                    'total': row[0] or 0,
-                    'ats_score': row[1] or 0,
-                    'keyword_score': row[2] or 0,
-                    'high_scoring': row[3] or 0
-                }
-            else:
-                metrics[period] = {
-                    'total': 0,
-                    'ats_score': 0,
-                    'keyword_score': 0,
-                    'high_scoring': 0
-                }
+        for period, start_day in periods:
+            start = start_day.strftime('%Y-%m-%d')
+            totals = [0, 0, 0, 0, 0, 0]
+            for row in daily:
+                if row[0] >= start:
+                    totals = [total + value for total, value in zip(totals, row[1:])]
+            resumes, ats_sum, ats_count, keyword_sum, keyword_count, high_scoring = totals
+            metrics[period] = {
+                'total': resumes,
+                'ats_score': round(ats_sum / ats_count, 1) if ats_count else 0,
+                'keyword_score': round(keyword_sum / keyword_count, 1) if keyword_count else 0,
+                'high_scoring': high_scoring
+            }
         
         return metrics
 
+    @cached_query
     def get_skill_distribution(self):
         """Get skill distribution data"""
         cursor = self.conn.cursor()
         cursor.execute("""
-            WITH RECURSIVE split(skill, rest) AS (
-                SELECT '', skills || ','
-                FROM resume_data
-                UNION ALL
-                SELECT
-                    substr(rest, 0, instr(rest, ',')),
-                    substr(rest, instr(rest, ',') + 1)
-                FROM split
-                WHERE rest <> ''
-            ),
-            SkillCategories AS (
-                SELECT 
-                    CASE 
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%python%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%java%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%javascript%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%c++%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%programming%' THEN 'Programming'
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%sql%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%database%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%mongodb%' THEN 'Database'
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%aws%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%cloud%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%azure%' THEN 'Cloud'
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%agile%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%scrum%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%management%' THEN 'Management'
-                        ELSE 'Other'
-                    END as category,
-                    COUNT(*) as count
-                FROM split
-                WHERE skill <> ''
-                GROUP BY category
-            )
-            SELECT category, count
-            FROM SkillCategories
+            SELECT skill_category as category, COUNT(*) as count
+            FROM resume_skills
+            GROUP BY skill_category
             ORDER BY count DESC
         """)
         
@@ -202,34 +183,35 @@ class DashboardManager:
             
         return categories, counts
 
+    @cached_query
     def get_weekly_trends(self):
         """Get weekly submission trends"""
         cursor = self.conn.cursor()
         now = datetime.now()
         dates = [(now - timedelta(days=x)).strftime('%Y-%m-%d') for x in range(6, -1, -1)]
         
-        submissions = []
-        for date in dates:
-            cursor.execute("""
-                SELECT COUNT(*) 
-                FROM resume_data 
-                WHERE DATE(created_at) = DATE(?)
-            """, (date,))
-            submissions.append(cursor.fetchone()[0])
+        cursor.execute("""
+            SELECT day, SUM(resumes)
+            FROM resume_daily_stats
+            WHERE day >= ?
+            GROUP BY day
+        """, (dates[0],))
+        daily_counts = dict(cursor.fetchall())
+        submissions = [daily_counts.get(date, 0) for date in dates]
             
         return [d[-3:] for d in dates], submissions  # Return shortened date format (e.g., 'Mon', 'Tue')
 
+    @cached_query
     def get_job_category_stats(self):
         """Get statistics by job category"""
         cursor = self.conn.cursor()
         cursor.execute("""
             SELECT 
-                COALESCE(target_category, 'Other') as category,
-                COUNT(*) as count,
-                ROUND(AVG(CASE WHEN ra.ats_score >= 70 THEN 1 ELSE 0 END) * 100, 1) as success_rate
-            FROM resume_data rd
-            LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-            GROUP BY category
+                COALESCE(NULLIF(category, ''), 'Other') as job_category,
+                SUM(resumes) as count,
+                ROUND(SUM(high_scoring) * 100.0 / NULLIF(SUM(resumes), 0), 1) as success_rate
+            FROM resume_daily_stats
+            GROUP BY job_category
             ORDER BY count DESC
             LIMIT 5
         """)
@@ -299,33 +281,37 @@ class DashboardManager:
 
     def get_resume_data(self):
         """Get all resume data"""
-        cursor = self.conn.cursor()
         try:
-            cursor.execute('''
-            SELECT 
-                r.id,
-                r.name,
-                r.email,
-                r.phone,
-                r.linkedin,
-                r.github,
-                r.portfolio,
-                r.target_role,
-                r.target_category,
-                r.created_at,
-                a.ats_score,
-                a.keyword_match_score,
-                a.format_score,
-                a.section_score
-            FROM resume_data r
-            LEFT JOIN resume_analysis a ON r.id = a.resume_id
-            ORDER BY r.created_at DESC
-            ''')
-            return cursor.fetchall()
+            return self._fetch_resume_data()
         except Exception as e:
             print(f"Error fetching resume data: {str(e)}")
             return []
 
+    @cached_query
+    def _fetch_resume_data(self):
+        cursor = self.conn.cursor()
+        cursor.execute('''
+        SELECT 
+            r.id,
+            r.name,
+            r.email,
+            r.phone,
+            r.linkedin,
+            r.github,
+            r.portfolio,
+            r.target_role,
+            r.target_category,
+            r.created_at,
+            a.ats_score,
+            a.keyword_match_score,
+            a.format_score,
+            a.section_score
+        FROM resume_data r
+        LEFT JOIN resume_analysis a ON r.id = a.resume_id
+        ORDER BY r.created_at DESC
+        ''')
+        return cursor.fetchall()
+
     def render_resume_data_section(self):
         """Render resume data section with Excel download"""
         st.markdown("<h2 class='section-title'>Resume Submissions</h2>", unsafe_allow_html=True)
@@ -475,96 +461,62 @@ class DashboardManager:
         else:
             st.info("No admin activity logs available")
 
+        self.render_extraction_stats_section()
+
+    def render_extraction_stats_section(self):
+        """Show how often each text extraction backend is used, accepted and how long it takes"""
+        # Imported here so the dashboard package (and the export and benchmark
+        # scripts that use it) does not load the whole utils package
+        from utils.text_extraction import get_text_extractor
+
+        st.markdown("<h2 class='section-title'>Text Extraction Backends</h2>", unsafe_allow_html=True)
+        stats = get_text_extractor().get_stats()
+        if not any(backend['calls'] for backend in stats):
+            st.info("No text extraction statistics recorded yet")
+            return
+
+        df = pd.DataFrame(stats)[[
+            'name', 'file_type', 'priority', 'calls', 'accepted', 'rejected', 'failures', 'success_rate', 'avg_seconds'
+        ]]
+        df.columns = ['Backend', 'File Type', 'Priority', 'Calls', 'Accepted', 'Rejected', 'Failures',
+                      'Success Rate', 'Avg Seconds']
+        st.dataframe(df, use_container_width=True, hide_index=True)
+
     def export_to_excel(self):
         """Export data to Excel format"""
-        query = """
-            SELECT 
-                rd.name, rd.email, rd.phone, rd.linkedin, rd.github, rd.portfolio,
-                rd.summary, rd.target_role, rd.target_category,
-                rd.education, rd.experience, rd.projects, rd.skills,
-                ra.ats_score, ra.keyword_match_score, ra.format_score, ra.section_score,
-                ra.missing_skills, ra.recommendations,
-                rd.created_at
-            FROM resume_data rd
-            LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-        """
         try:
-            df = pd.read_sql_query(query, self.conn)
-            
-            # Create Excel writer object
-            output = BytesIO()
-            with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-                # Write main data
-                df.to_excel(writer, sheet_name='Resume Data', index=False)
-                
-                # Get the workbook and the worksheet
-                workbook = writer.book
-                worksheet = writer.sheets['Resume Data']
-                
-                # Add formatting
-                header_format = workbook.add_format({
-                    'bold': True,
-                    'text_wrap': True,
-                    'valign': 'top',
-                    'fg_color': '#D7E4BC',
-                    'border': 1
-                })
-                
-                # Write headers with formatting
-                for col_num, value in enumerate(df.columns.values):
-                    worksheet.write(0, col_num, value, header_format)
-                    
-                # Auto-adjust columns' width
-                for i, col in enumerate(df.columns):
-                    max_length = max(
-                        df[col].astype(str).apply(len).max(),
-                        len(str(col))
-                    ) + 2
-                    worksheet.set_column(i, i, min(max_length, 50))
-            
-            # Return the Excel file
-            output.seek(0)
-            return output.getvalue()
-            
+            return export_excel(self.conn, RESUME_EXPORT_QUERY, 'Resume Data')
         except Exception as e:
             st.error(f"Error exporting to Excel: {str(e)}")
             return None
 
     def export_to_csv(self):
         """Export data to CSV format"""
-        query = """
-            SELECT 
-                rd.name, rd.email, rd.phone, rd.linkedin, rd.github, rd.portfolio,
-                rd.summary, rd.target_role, rd.target_category,
-                rd.education, rd.experience, rd.projects, rd.skills,
-                ra.ats_score, ra.keyword_match_score, ra.format_score, ra.section_score,
-                ra.missing_skills, ra.recommendations,
-                rd.created_at
-            FROM resume_data rd
-            LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-        """
         try:
-            df = pd.read_sql_query(query, self.conn)
-            return df.to_csv(index=False).encode('utf-8')
+            return export_csv(self.conn, RESUME_EXPORT_QUERY)
         except Exception as e:
             st.error(f"Error exporting to CSV: {str(e)}")
             return None
 
     def export_to_json(self):
         """Export data to JSON format"""
+        # Analysis columns that clash with resume_data names are prefixed
         query = """
             SELECT 
-                rd.*, ra.*
+                rd.*,
+                ra.id as analysis_id, ra.resume_id, ra.ats_score, ra.keyword_match_score,
+                ra.format_score, ra.section_score, ra.missing_skills, ra.recommendations,
+                ra.created_at as analysis_created_at
             FROM resume_data rd
             LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
         """
         try:
-            df = pd.read_sql_query(query, self.conn)
-            return df.to_json(orient='records', date_format='iso')
+            return export_json(self.conn, query)
         except Exception as e:
             st.error(f"Error exporting to JSON: {str(e)}")
             return None
 
+    @cached_query
     def get_database_stats(self):
         """Get database statistics"""
         cursor = self.conn.cursor()
@@ -576,9 +528,9 @@ class DashboardManager:
         
         # Today's submissions
         cursor.execute("""
-            SELECT COUNT(*) 
-            FROM resume_data 
-            WHERE DATE(created_at) = DATE('now')
+            SELECT COALESCE(SUM(resumes), 0)
+            FROM resume_daily_stats 
+            WHERE day = DATE('now')
         """)
         stats['today_submissions'] = cursor.fetchone()[0]
         
@@ -600,17 +552,22 @@ class DashboardManager:
 
     def get_admin_logs(self):
         """Get admin logs"""
-        cursor = self.conn.cursor()
         try:
-            cursor.execute('''
-            SELECT admin_email, action, timestamp
-            FROM admin_logs
-            ORDER BY timestamp DESC
-            ''')
-            return cursor.fetchall()
+            return self._fetch_admin_logs()
         except Exception as e:
             print(f"Error fetching admin logs: {str(e)}")
             return []
+
+    @cached_query
+    def _fetch_admin_logs(self):
+        cursor = self.conn.cursor()
+        cursor.execute('''
+        SELECT admin_email, action, timestamp
+        FROM admin_logs
+        ORDER BY timestamp DESC
+        ''')
+        return cursor.fetchall()
+
     def add_back_to_home_button(self):
         st.markdown("""
         <style>
@@ -878,50 +835,23 @@ class DashboardManager:
 
     def get_trend_indicators(self):
         """Get trend indicators for stats"""
-        cursor = self.conn.cursor()
         indicators = {}
         
-        # Compare with last week's data
+        # Compare with last week's data; only resumes and ATS score have a history to compare
+        try:
+            changes = self._fetch_trend_changes()
+        except Exception:
+            changes = {}
+        
         for metric in ['resumes', 'ats', 'high_performing', 'success_rate']:
-            try:
-                if metric == 'resumes':
-                    cursor.execute("""
-                        SELECT 
-                            (COUNT(*) - (
-                                SELECT COUNT(*) 
-                                FROM resume_data 
-                                WHERE created_at < date('now', '-7 days')
-                            )) * 100.0 / 
-                            NULLIF((
-                                SELECT COUNT(*) 
-                                FROM resume_data 
-                                WHERE created_at < date('now', '-7 days')
-                            ), 0)
-                        FROM resume_data
-                    """)
-                elif metric == 'ats':
-                    cursor.execute("""
-                        SELECT 
-                            (AVG(ats_score) - (
-                                SELECT AVG(ats_score) 
-                                FROM resume_analysis 
-                                WHERE created_at < date('now', '-7 days')
-                            )) * 100.0 / 
-                            NULLIF((
-                                SELECT AVG(ats_score) 
-                                FROM resume_analysis 
-                                WHERE created_at < date('now', '-7 days')
-                            ), 0)
-                        FROM resume_analysis
-                    """)
-                
-                change = cursor.fetchone()[0] or 0
+            if metric in changes:
+                change = changes[metric]
                 indicators[metric] = {
                     'value': abs(round(change, 1)),
                     'icon': '↑' if change >= 0 else '↓',
                     'class': 'trend-up' if change >= 0 else 'trend-down'
                 }
-            except Exception:
+            else:
                 indicators[metric] = {
                     'value': 0,
                     'icon': '→',
@@ -930,6 +860,25 @@ class DashboardManager:
         
         return indicators
 
+    @cached_query
+    def _fetch_trend_changes(self):
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT 
+                SUM(resumes),
+                SUM(CASE WHEN day < date('now', '-7 days') THEN resumes END),
+                SUM(ats_sum) / NULLIF(SUM(ats_count), 0),
+                SUM(CASE WHEN day < date('now', '-7 days') THEN ats_sum END) /
+                    NULLIF(SUM(CASE WHEN day < date('now', '-7 days') THEN ats_count END), 0)
+            FROM resume_daily_stats
+        """)
+        total, old_total, avg_ats, old_avg_ats = cursor.fetchone()
+        return {
+            'resumes': (total - old_total) * 100.0 / old_total if old_total else 0,
+            'ats': (avg_ats - old_avg_ats) * 100.0 / old_avg_ats if avg_ats and old_avg_ats else 0
+        }
+
+    @cached_query
     def get_detailed_insights(self):
         """Get detailed insights from the database"""
         cursor = self.conn.cursor()
@@ -937,11 +886,12 @@ class DashboardManager:
         
         # Most Successful Job Category
         cursor.execute("""
-            SELECT target_category, AVG(ats_score) as avg_score,
-                   COUNT(*) as submission_count
-            FROM resume_data rd
-            JOIN resume_analysis ra ON rd.id = ra.resume_id
-            GROUP BY target_category
+            SELECT NULLIF(category, '') as target_category,
+                   SUM(ats_sum) / NULLIF(SUM(ats_count), 0) as avg_score,
+                   SUM(analyses) as submission_count
+            FROM resume_daily_stats
+            GROUP BY category
+            HAVING SUM(analyses) > 0
             ORDER BY avg_score DESC
             LIMIT 1
         """)
@@ -959,10 +909,11 @@ class DashboardManager:
         # Recent Improvement
         cursor.execute("""
             SELECT 
-                (SELECT AVG(ats_score) FROM resume_analysis 
-                 WHERE created_at >= date('now', '-7 days')) as recent_score,
-                (SELECT AVG(ats_score) FROM resume_analysis 
-                 WHERE created_at < date('now', '-7 days')) as old_score
+                SUM(CASE WHEN day >= date('now', '-7 days') THEN ats_sum END) /
+                    NULLIF(SUM(CASE WHEN day >= date('now', '-7 days') THEN ats_count END), 0) as recent_score,
+                SUM(CASE WHEN day < date('now', '-7 days') THEN ats_sum END) /
+                    NULLIF(SUM(CASE WHEN day < date('now', '-7 days') THEN ats_count END), 0) as old_score
+            FROM resume_daily_stats
         """)
         scores = cursor.fetchone()
         if scores and scores[0] and scores[1]:
@@ -978,32 +929,15 @@ class DashboardManager:
         
         # Most Common Skills
         cursor.execute("""
-            WITH RECURSIVE
-            split(skill, rest) AS (
-                SELECT '', skills || ',' 
-                FROM resume_data 
-                WHERE skills IS NOT NULL
-                UNION ALL
-                SELECT
-                    substr(rest, 0, instr(rest, ',')),
-                    substr(rest, instr(rest, ',') + 1)
-                FROM split 
-                WHERE rest <> ''
-            ),
-            cleaned_skills AS (
-                SELECT TRIM(REPLACE(REPLACE(skill, '[', ''), ']', '')) as skill
-                FROM split 
-                WHERE skill <> ''
-            )
-            SELECT skill, COUNT(*) as count
-            FROM cleaned_skills
-            GROUP BY skill
+            SELECT skill_name, COUNT(*) as count
+            FROM resume_skills
+            GROUP BY skill_name COLLATE NOCASE
             ORDER BY count DESC
             LIMIT 3
         """)
         top_skills = cursor.fetchall()
         if top_skills:
-            skills_text = f"Most in-demand skills: Python ({top_skills[0][1]} resumes), Java ({top_skills[1][1]} resumes), Express ({top_skills[2][1]} resumes)"
+            skills_text = ", ".join(f"{skill} ({count} resumes)" for skill, count in top_skills)
             insights.append({
                 'title': 'Top Skills',
                 'icon': '💡',
@@ -1015,21 +949,20 @@ class DashboardManager:
         
         return insights
 
+    @cached_query
     def get_quick_stats(self):
         """Get quick statistics for the dashboard"""
         cursor = self.conn.cursor()
         
-        # Total Resumes
-        cursor.execute("SELECT COUNT(*) FROM resume_data")
-        total_resumes = cursor.fetchone()[0]
-        
-        # Average ATS Score
-        cursor.execute("SELECT AVG(ats_score) FROM resume_analysis")
-        avg_ats = cursor.fetchone()[0] or 0
-        
-        # High Performing Resumes
-        cursor.execute("SELECT COUNT(*) FROM resume_analysis WHERE ats_score >= 70")
-        high_performing = cursor.fetchone()[0]
+        # Total resumes, average ATS score and high performing resumes in one rollup pass
+        cursor.execute("""
+            SELECT SUM(resumes), SUM(ats_sum) / NULLIF(SUM(ats_count), 0), SUM(high_scoring)
+            FROM resume_daily_stats
+        """)
+        total_resumes, avg_ats, high_performing = cursor.fetchone()
+        total_resumes = total_resumes or 0
+        avg_ats = avg_ats or 0
+        high_performing = high_performing or 0
         
         # Success Rate
         success_rate = (high_performing / total_resumes * 100) if total_resumes > 0 else 0
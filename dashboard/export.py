@@ -0,0 +1,131 @@
+"""
+Streaming exports of dashboard tables. Rows are fetched from SQLite in
+chunks and serialized straight into a spooled temporary file, so memory use
+is bounded by the chunk size while exporting and by the finished file when
+it is handed to Streamlit.
+"""
+
+import csv
+import io
+import itertools
+import json
+import os
+import shutil
+import tempfile
+
+# Rows fetched from SQLite per round trip
+EXPORT_CHUNK_ROWS = 1000
+# Excel column widths are sized from this many leading rows
+WIDTH_SAMPLE_ROWS = 1000
+MAX_COLUMN_WIDTH = 50
+# Exports larger than this spill from memory to a temporary file
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+EXCEL_HEADER_FORMAT = {
+    'bold': True,
+    'text_wrap': True,
+    'valign': 'top',
+    'fg_color': '#D7E4BC',
+    'border': 1
+}
+
+
+def query_chunks(conn, query, params=(), chunk_rows=EXPORT_CHUNK_ROWS):
+    """Run query and return (column names, iterator over lists of up to chunk_rows rows)"""
+    cursor = conn.cursor()
+    cursor.execute(query, params)
+    columns = [description[0] for description in cursor.description]
+
+    def chunks():
+        while True:
+            rows = cursor.fetchmany(chunk_rows)
+            if not rows:
+                return
+            yield rows
+
+    return columns, chunks()
+
+
+def _read_back(output):
+    output.seek(0)
+    data = output.read()
+    output.close()
+    return data
+
+
+def export_csv(conn, query, params=(), chunk_rows=EXPORT_CHUNK_ROWS):
+    """Return the query results as UTF-8 CSV bytes with a header row"""
+    columns, chunks = query_chunks(conn, query, params, chunk_rows)
+    output = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+
+    writer.writerow(columns)
+    for rows in chunks:
+        writer.writerows(rows)
+        output.write(buffer.getvalue().encode('utf-8'))
+        buffer.seek(0)
+        buffer.truncate()
+    output.write(buffer.getvalue().encode('utf-8'))
+    return _read_back(output)
+
+
+def export_json(conn, query, params=(), chunk_rows=EXPORT_CHUNK_ROWS):
+    """Return the query results as a UTF-8 JSON array of records (one object per row)"""
+    columns, chunks = query_chunks(conn, query, params, chunk_rows)
+    output = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+
+    output.write(b'[')
+    separator = b''
+    for rows in chunks:
+        records = ','.join(json.dumps(dict(zip(columns, row)), separators=(',', ':')) for row in rows)
+        output.write(separator + records.encode('utf-8'))
+        separator = b','
+    output.write(b']')
+    return _read_back(output)
+
+
+def column_widths(columns, sample_rows):
+    """Return an Excel width per column from the header and a sample of rows"""
+    widths = []
+    for index, column in enumerate(columns):
+        longest = max((len(str(row[index])) for row in sample_rows if row[index] is not None), default=0)
+        widths.append(min(max(longest, len(str(column))) + 2, MAX_COLUMN_WIDTH))
+    return widths
+
+
+def export_excel(conn, query, sheet_name, params=(), chunk_rows=EXPORT_CHUNK_ROWS):
+    """Return the query results as .xlsx bytes.
+
+    The workbook is written with xlsxwriter's constant_memory mode, which
+    flushes each row to disk as soon as the next one starts; column widths
+    come from the first WIDTH_SAMPLE_ROWS rows.
+    """
+    import xlsxwriter
+
+    columns, chunks = query_chunks(conn, query, params, chunk_rows)
+    sample = []
+    for rows in chunks:
+        sample.extend(rows)
+        if len(sample) >= WIDTH_SAMPLE_ROWS:
+            break
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'export.xlsx')
+        workbook = xlsxwriter.Workbook(path, {'constant_memory': True})
+        worksheet = workbook.add_worksheet(sheet_name)
+        for index, width in enumerate(column_widths(columns, sample[:WIDTH_SAMPLE_ROWS])):
+            worksheet.set_column(index, index, width)
+        worksheet.write_row(0, 0, columns, workbook.add_format(EXCEL_HEADER_FORMAT))
+
+        row_number = 1
+        for rows in itertools.chain([sample], chunks):
+            for row in rows:
+                worksheet.write_row(row_number, 0, row)
+                row_number += 1
+        workbook.close()
+
+        output = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+        with open(path, 'rb') as workbook_file:
+            shutil.copyfileobj(workbook_file, output)
+    return _read_back(output)
@@ -0,0 +1,82 @@
+import functools
+import threading
+import time
+from datetime import date
+
+from config.database import get_data_version
+
+# Fallback lifetime of a cached result, for changes the data version cannot
+# see (database file size, 'now' moving past a date boundary in SQL)
+DEFAULT_TTL = 300
+
+
+class QueryCache:
+    """Process-wide cache of dashboard query results.
+
+    An entry is reused while the database's data version (bumped by
+    triggers on every write to the dashboard tables) is unchanged and the
+    entry is younger than ``ttl`` seconds. Cached values are shared between
+    callers and must not be mutated.
+    """
+
+    def __init__(self, ttl=DEFAULT_TTL):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key, version, compute):
+        """Return the cached value for key at this version, or store and return ``compute()``"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version and now - entry[1] < self.ttl:
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        value = compute()
+        with self._lock:
+            self._entries[key] = (version, now, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+_cache = QueryCache()
+
+
+def get_query_cache():
+    """Return the process-wide dashboard query cache"""
+    return _cache
+
+
+def _database_file(conn):
+    # Row of PRAGMA database_list for "main": (seq, name, file)
+    return conn.execute('PRAGMA database_list').fetchone()[2]
+
+
+def cached_query(method):
+    """Serve a DashboardManager query method from the process-wide cache.
+
+    DashboardManager is rebuilt on every Streamlit rerun, so entries are
+    keyed by database file, method, arguments and today's date rather than
+    by instance. Before the data_version table exists every call goes
+    straight to the database. A query that raises is not cached, so methods
+    with a fallback value catch errors outside the decorated method.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args):
+        version = get_data_version(self.conn)
+        if version is None:
+            return method(self, *args)
+        key = (_database_file(self.conn), method.__name__, args, date.today().isoformat())
+        return _cache.get_or_compute(key, version, lambda: method(self, *args))
+    return wrapper
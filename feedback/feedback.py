@@ -5,6 +5,14 @@ import pandas as pd
 import time
 import re
 
+# Compiled here rather than imported from utils.patterns: importing anything
+# from the utils package runs utils/__init__, which pulls in the resume
+# analyzers and their dependencies
+EMAIL_ADDRESS_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# Indian mobile numbers, with or without 91/+91
+FEEDBACK_PHONE_SEPARATORS_RE = re.compile(r'[\s\-\(\)]')
+INDIAN_MOBILE_RE = re.compile(r'^(?:[6-9]\d{9}|\+91[6-9]\d{9}|91[6-9]\d{9})$')
+
 class FeedbackManager:
     def __init__(self):
         self.db_path = "feedback/feedback.db"
@@ -57,22 +65,15 @@ class FeedbackManager:
 
     def validate_email(self, email):
         """Validate email format"""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return EMAIL_ADDRESS_RE.match(email) is not None
 
     def validate_phone(self, phone):
         """Validate phone number format (Indian mobile numbers)"""
         # Remove any spaces, dashes, or parentheses
-        phone_clean = re.sub(r'[\s\-\(\)]', '', phone)
-        
-        # Check for Indian mobile number patterns
-        patterns = [
-            r'^[6-9]\d{9}$',  # 10 digit starting with 6-9
-            r'^\+91[6-9]\d{9}$',  # +91 followed by 10 digits
-            r'^91[6-9]\d{9}$',  # 91 followed by 10 digits
-        ]
+        phone_clean = FEEDBACK_PHONE_SEPARATORS_RE.sub('', phone)
         
-        return any(re.match(pattern, phone_clean) for pattern in patterns)
+        # 10 digits starting with 6-9, optionally prefixed by 91 or +91
+        return INDIAN_MOBILE_RE.match(phone_clean) is not None
 
     def save_feedback(self, feedback_data):
         """Save feedback to database"""
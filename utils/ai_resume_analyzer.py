@@ -1,10 +1,12 @@
 import os
 from dotenv import load_dotenv
-import pdfplumber
-import tempfile
+import io
 import re
 from groq import Groq
 
+from utils.extraction_cache import file_bytes, get_extraction_cache
+from utils.text_extraction import extract_pages, pdfplumber_pages
+
 class AIResumeAnalyzer:
     def __init__(self):
         load_dotenv()
@@ -17,57 +19,34 @@ class AIResumeAnalyzer:
     
     def extract_text_from_pdf(self, pdf_file):
         """Extract text from PDF using pdfplumber"""
-        text = ""
-        
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-            if hasattr(pdf_file, 'getbuffer'):
-                temp_file.write(pdf_file.getbuffer())
-            elif hasattr(pdf_file, 'read'):
-                temp_file.write(pdf_file.read())
-                pdf_file.seek(0)
-            else:
-                temp_file.write(pdf_file)
-            temp_path = temp_file.name
-        
+        data = file_bytes(pdf_file)
+        return get_extraction_cache().get_or_extract('pdfplumber', data, self._parse_pdf)
+
+    def _parse_pdf(self, data):
+        """Extract text from PDF bytes in memory, without a temporary file"""
         try:
-            with pdfplumber.open(temp_path) as pdf:
-                for page in pdf.pages:
-                    try:
-                        import warnings
-                        with warnings.catch_warnings():
-                            warnings.filterwarnings("ignore")
-                            page_text = page.extract_text()
-                            if page_text:
-                                text += page_text + "\n"
-                    except Exception:
-                        pass
-            
-            os.unlink(temp_path)
-            return text.strip()
+            pages = extract_pages(pdfplumber_pages, data)
+            return ''.join(page_text + "\n" for page_text in pages if page_text).strip()
         except Exception:
-            try:
-                os.unlink(temp_path)
-            except:
-                pass
             return ""
     
     def extract_text_from_docx(self, docx_file):
         """Extract text from DOCX file"""
         from docx import Document
         
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.docx') as temp_file:
-            temp_file.write(docx_file.getbuffer())
-            temp_path = temp_file.name
+        # Wrap the upload's buffer directly so nothing touches the filesystem
+        if hasattr(docx_file, 'getbuffer'):
+            buffer = io.BytesIO(docx_file.getbuffer())
+        else:
+            buffer = io.BytesIO(file_bytes(docx_file))
         
         text = ""
         try:
-            doc = Document(temp_path)
-            for para in doc.paragraphs:
-                text += para.text + "\n"
+            doc = Document(buffer)
+            text = ''.join(para.text + "\n" for para in doc.paragraphs)
         except Exception:
             pass
         
-        os.unlink(temp_path)
         return text
     
     def optimize_resume_with_gemini(self, resume_text, job_description=None, job_role=None):
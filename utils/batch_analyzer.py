@@ -0,0 +1,87 @@
+from concurrent.futures import as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from utils.process_pool import get_process_pool, reset_process_pool
+from utils.resume_analyzer import ResumeAnalyzer
+from utils.text_extraction import get_text_extractor
+
+# One analyzer per worker process, created on first use
+_worker_analyzer = None
+
+
+def _get_worker_analyzer():
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        _worker_analyzer = ResumeAnalyzer()
+    return _worker_analyzer
+
+
+def extract_and_analyze(index, filename, file_type, data, role_info):
+    """Extract text from raw file bytes and run the rule-based analysis.
+
+    Runs inside a worker process, so it only takes and returns picklable
+    values. The returned dict carries a ``status`` of ``ok``,
+    ``extract_failed`` (every extraction backend failed) or ``empty``.
+    """
+    analyzer = _get_worker_analyzer()
+    result = {'index': index, 'filename': filename, 'status': 'ok', 'error': '', 'text': '', 'analysis': None}
+
+    # Clearly non-resume uploads are rejected from their first pages without a full parse
+    rejection, page_count = analyzer.screen_document(data, file_type)
+    if rejection is not None:
+        result['analysis'] = rejection
+        return result
+
+    try:
+        text = get_text_extractor().extract(data, file_type, page_count)
+    except Exception as e:
+        result['status'] = 'extract_failed'
+        result['error'] = str(e)
+        return result
+
+    if not text or text.strip() == "":
+        result['status'] = 'empty'
+        return result
+
+    result['text'] = text
+    result['analysis'] = analyzer.analyze_resume({'raw_text': text}, role_info)
+    return result
+
+
+class BatchResumeAnalyzer:
+    """Extract and analyze many uploaded resumes across a process pool"""
+
+    def __init__(self, use_processes=True):
+        self.use_processes = use_processes
+
+    def analyze(self, uploaded_files, role_info):
+        """Yield one result dict per file, in the order the files finish.
+
+        Each result has the shape returned by ``extract_and_analyze`` plus
+        ``uploaded_file`` so the caller can report on it.
+        Falls back to analyzing in this process if the pool is unavailable.
+        """
+        jobs = [
+            (index, uploaded_file.name, uploaded_file.type, uploaded_file.getvalue(), role_info)
+            for index, uploaded_file in enumerate(uploaded_files)
+        ]
+        pending = set(range(len(jobs)))
+
+        if self.use_processes and len(jobs) > 1:
+            try:
+                executor = get_process_pool()
+                futures = [executor.submit(extract_and_analyze, *job) for job in jobs]
+                for future in as_completed(futures):
+                    result = future.result()
+                    pending.discard(result['index'])
+                    result['uploaded_file'] = uploaded_files[result['index']]
+                    yield result
+            except (BrokenProcessPool, OSError, RuntimeError) as e:
+                print(f"Process pool unavailable, analyzing in-process: {e}")
+                reset_process_pool()
+
+        # Serial path, also used to finish any files left by a failed pool
+        for index in sorted(pending):
+            result = extract_and_analyze(*jobs[index])
+            result['uploaded_file'] = uploaded_files[index]
+            yield result
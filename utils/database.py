@@ -1,8 +1,18 @@
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, func
+from sqlalchemy import create_engine, event, Column, Integer, String, Text, DateTime, func
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import QueuePool
 import datetime
 import json
+import threading
+
+from config.database import CONNECTION_PRAGMAS
+
+DATABASE_URL = 'sqlite:///resume_data.db'
+
+# Connections kept open per engine, plus how many more may be opened under load
+POOL_SIZE = 5
+MAX_OVERFLOW = 10
 
 # Create the base class for declarative models
 Base = declarative_base()
@@ -37,12 +47,50 @@ class AIAnalysis(Base):
     job_role = Column(String(100))
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
 
+# url -> (engine, session factory, thread-local scoped session)
+_engines = {}
+_engine_lock = threading.Lock()
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for pragma in CONNECTION_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+def _get_engine_entry(url):
+    with _engine_lock:
+        entry = _engines.get(url)
+        if entry is None:
+            engine = create_engine(
+                url,
+                poolclass=QueuePool,
+                pool_size=POOL_SIZE,
+                max_overflow=MAX_OVERFLOW,
+                # Pooled connections are handed between Streamlit script threads
+                connect_args={'check_same_thread': False, 'timeout': 5}
+            )
+            event.listen(engine, 'connect', _set_sqlite_pragmas)
+            # Schema check runs once per engine, not on every call
+            Base.metadata.create_all(engine)
+            factory = sessionmaker(bind=engine)
+            entry = (engine, factory, scoped_session(factory))
+            _engines[url] = entry
+        return entry
+
+def get_engine(url=DATABASE_URL):
+    """Return the process-wide engine for url, creating it and its tables on first use"""
+    return _get_engine_entry(url)[0]
+
+def get_session(url=DATABASE_URL):
+    """Return this thread's session for url; close() it when done"""
+    return _get_engine_entry(url)[2]()
+
 class DatabaseManager:
     def __init__(self, db_path='resume_data.db'):
-        self.engine = create_engine(f'sqlite:///{db_path}')
-        Base.metadata.create_all(self.engine)
-        Session = sessionmaker(bind=self.engine)
-        self.session = Session()
+        # Shares the process-wide engine (and its connection pool) for this file
+        engine, factory, _ = _get_engine_entry(f'sqlite:///{db_path}')
+        self.engine = engine
+        self.session = factory()
     
     def save_resume(self, user_id, job_role, content):
         resume = Resume(
@@ -79,11 +127,8 @@ class DatabaseManager:
         self.session.close()
 
 def get_database_connection():
-    """Get a connection to the database"""
-    engine = create_engine('sqlite:///resume_data.db')
-    Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
-    return Session()
+    """Get a session on the shared engine"""
+    return get_session()
 
 def save_resume_data(resume_data):
     """Save resume data to the database"""
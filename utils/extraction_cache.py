@@ -0,0 +1,187 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+# Extracted resume text is personal data, so the on-disk tier lives in a
+# private per-user cache directory rather than the working directory, and
+# entries expire MAX_ENTRY_AGE seconds after they were extracted
+CACHE_DIR = os.environ.get('CAREERIQ_CACHE_DIR') or os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'careeriq'
+)
+CACHE_DB_PATH = os.path.join(CACHE_DIR, 'extraction_cache.db')
+MEMORY_ENTRIES = 64
+MAX_DISK_BYTES = 64 * 1024 * 1024
+MAX_ENTRY_AGE = 24 * 3600
+
+
+def file_bytes(file):
+    """Return the raw bytes of an upload, file-like object or bytes value"""
+    if isinstance(file, (bytes, bytearray, memoryview)):
+        return bytes(file)
+    if hasattr(file, 'getvalue'):
+        return file.getvalue()
+    content = file.read()
+    file.seek(0)  # Reset file pointer
+    return content
+
+
+class ExtractionCache:
+    """Two-tier cache of extracted document text keyed by a SHA-256 of the file bytes.
+
+    Recent entries are kept in an in-memory LRU; everything is also written
+    to a SQLite table that is trimmed, least recently used first, once its
+    total text size exceeds ``max_disk_bytes``. Entries in both tiers expire
+    ``max_age`` seconds after they were stored, however often they are hit.
+    Keys include the extractor name because each backend produces slightly
+    different text.
+    """
+
+    def __init__(self, db_path=CACHE_DB_PATH, memory_entries=MEMORY_ENTRIES, max_disk_bytes=MAX_DISK_BYTES,
+                 max_age=MAX_ENTRY_AGE):
+        self.db_path = db_path
+        self.memory_entries = memory_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.max_age = max_age
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_ready = False
+
+    @staticmethod
+    def make_key(extractor, data):
+        return f"{extractor}:{hashlib.sha256(data).hexdigest()}"
+
+    def _connect(self):
+        if not self._disk_ready:
+            os.makedirs(os.path.dirname(self.db_path) or '.', mode=0o700, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        if not self._disk_ready:
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS extracted_text (
+                cache_key TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_extracted_text_last_used ON extracted_text (last_used)')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_extracted_text_created_at ON extracted_text (created_at)')
+            conn.commit()
+            self._disk_ready = True
+        return conn
+
+    def _remember(self, key, text, created_at):
+        self._memory[key] = (text, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key):
+        """Return cached text for key, or None on a miss or an expired entry"""
+        now = time.time()
+        with self._lock:
+            if key in self._memory:
+                text, created_at = self._memory[key]
+                if now - created_at < self.max_age:
+                    self._memory.move_to_end(key)
+                    return text
+                del self._memory[key]
+
+            try:
+                conn = self._connect()
+                try:
+                    row = conn.execute(
+                        'SELECT text, created_at FROM extracted_text WHERE cache_key = ? AND created_at > ?',
+                        (key, now - self.max_age)
+                    ).fetchone()
+                    if row is None:
+                        return None
+                    conn.execute('UPDATE extracted_text SET last_used = ? WHERE cache_key = ?', (now, key))
+                    conn.commit()
+                finally:
+                    conn.close()
+            except (sqlite3.Error, OSError) as e:
+                print(f"Extraction cache read failed: {e}")
+                return None
+
+            self._remember(key, row[0], row[1])
+            return row[0]
+
+    def put(self, key, text):
+        """Store text under key in both tiers, dropping expired entries and evicting old ones if needed"""
+        size = len(text.encode('utf-8'))
+        now = time.time()
+        with self._lock:
+            self._remember(key, text, now)
+            if size > self.max_disk_bytes:
+                return
+
+            try:
+                conn = self._connect()
+                try:
+                    conn.execute('DELETE FROM extracted_text WHERE created_at <= ?', (now - self.max_age,))
+                    conn.execute(
+                        'INSERT OR REPLACE INTO extracted_text (cache_key, text, size, created_at, last_used) '
+                        'VALUES (?, ?, ?, ?, ?)',
+                        (key, text, size, now, now)
+                    )
+                    total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM extracted_text').fetchone()[0]
+                    if total > self.max_disk_bytes:
+                        self._evict(conn, total - self.max_disk_bytes)
+                    conn.commit()
+                finally:
+                    conn.close()
+            except (sqlite3.Error, OSError) as e:
+                print(f"Extraction cache write failed: {e}")
+
+    def _evict(self, conn, excess):
+        """Delete least recently used rows until at least ``excess`` bytes are freed"""
+        freed = 0
+        stale = []
+        for cache_key, size in conn.execute('SELECT cache_key, size FROM extracted_text ORDER BY last_used'):
+            stale.append((cache_key,))
+            freed += size
+            if freed >= excess:
+                break
+        conn.executemany('DELETE FROM extracted_text WHERE cache_key = ?', stale)
+
+    def get_or_extract(self, extractor, data, extract):
+        """Return cached text for these bytes, or run ``extract(data)`` and cache a non-empty result"""
+        key = self.make_key(extractor, data)
+        text = self.get(key)
+        if text is not None:
+            return text
+
+        text = extract(data)
+        if text and text.strip():
+            self.put(key, text)
+        return text
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            try:
+                conn = self._connect()
+                try:
+                    conn.execute('DELETE FROM extracted_text')
+                    conn.commit()
+                finally:
+                    conn.close()
+            except (sqlite3.Error, OSError) as e:
+                print(f"Extraction cache clear failed: {e}")
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_extraction_cache():
+    """Return the process-wide extraction cache"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ExtractionCache()
+        return _cache
@@ -0,0 +1,70 @@
+import re
+
+
+class KeywordMatcher:
+    """Find every occurrence of a fixed set of keywords in a single scan.
+
+    The keywords are compiled into one trie-shaped regex wrapped in a
+    lookahead, so the scan tries each text position once and picks the
+    longest keyword starting there. Shorter keywords that start at the same
+    position are always prefixes of that longest one, so they are recovered
+    from a precomputed prefix table instead of extra passes over the text.
+    Matching is case-sensitive; lowercase both sides for case-insensitive use.
+    """
+
+    def __init__(self, keywords):
+        # Keep first-seen order and drop empty strings, which would match everywhere
+        self.keywords = list(dict.fromkeys(keyword for keyword in keywords if keyword))
+        self._vocabulary = set(self.keywords)
+        self._prefixes = {
+            keyword: [other for other in self.keywords if keyword.startswith(other)]
+            for keyword in self.keywords
+        }
+        self._pattern = None
+        if self.keywords:
+            self._pattern = re.compile('(?=(' + self._build_trie_pattern(self.keywords) + '))', re.DOTALL)
+
+    @staticmethod
+    def _build_trie_pattern(keywords):
+        """Build a regex from a character trie so shared prefixes are tested once"""
+        trie = {}
+        for keyword in keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[''] = True
+
+        def to_pattern(node):
+            terminal = '' in node
+            branches = [re.escape(char) + to_pattern(child)
+                        for char, child in sorted(node.items()) if char]
+            if not branches:
+                return ''
+            body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+            # Greedy optional keeps the longest keyword when a shorter one also ends here
+            return '(?:' + body + ')?' if terminal else body
+
+        return to_pattern(trie)
+
+    def __contains__(self, keyword):
+        return keyword in self._vocabulary
+
+    def finditer(self, text):
+        """Yield (position, keyword) for every keyword occurrence in text"""
+        if self._pattern is None:
+            return
+        for match in self._pattern.finditer(text):
+            start = match.start()
+            for keyword in self._prefixes[match.group(1)]:
+                yield start, keyword
+
+    def find_all(self, text):
+        """Return a dict mapping each keyword found to its list of positions"""
+        hits = {}
+        for start, keyword in self.finditer(text):
+            hits.setdefault(keyword, []).append(start)
+        return hits
+
+    def found(self, text):
+        """Return the set of keywords that occur anywhere in text"""
+        return {keyword for _, keyword in self.finditer(text)}
@@ -0,0 +1,48 @@
+"""
+Precompiled regular expressions shared by resume analysis and the
+resume builder's validators. These run on every Streamlit rerun, so they
+are compiled once at import time.
+"""
+
+import re
+
+# Personal info extraction (ResumeAnalyzer.extract_personal_info)
+EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+PHONE_RE = re.compile(r'(\+\d{1,3}[-.]?)?\s*\(?\d{3}\)?[-.]?\s*\d{3}[-.]?\s*\d{4}')
+LINKEDIN_RE = re.compile(r'linkedin\.com/in/[\w-]+')
+GITHUB_RE = re.compile(r'github\.com/[\w-]+')
+
+# Email, phone, LinkedIn and GitHub formats fused into one alternation, so
+# checking whether any contact detail is present is a single scan
+CONTACT_INFO_RE = re.compile(
+    r'(?P<email>\b[\w\.-]+@[\w\.-]+\.\w+\b)'
+    r'|(?P<phone>\b\d{3}[-.]?\d{3}[-.]?\d{4}\b)'
+    r'|(?P<linkedin>linkedin\.com/in/[a-zA-Z0-9-]+)'
+    r'|(?P<github>github\.com/[a-zA-Z0-9-]+)'
+)
+
+# Resume content checks
+SUMMARY_CONTACT_WORDS_RE = re.compile(r'\b(?:email|phone|address|tel|mobile|linkedin)\b')
+YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+BULLET_RE = re.compile(r'[•\-\*]')
+ACTION_VERB_RE = re.compile(r'\b(developed|managed|created|implemented|designed|led|improved)\b')
+DEGREE_RE = re.compile(r'\b(bachelor|master|phd|b\.|m\.|diploma)\b')
+GPA_RE = re.compile(r'\b(gpa|cgpa|grade|percentage)\b')
+
+# Resume builder form validation
+FULL_NAME_RE = re.compile(r"^[a-zA-Z\s\-'\.]+$")
+EMAIL_ADDRESS_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+PHONE_SEPARATORS_RE = re.compile(r'[\s\-\(\)\.]')
+PHONE_DIGITS_RE = re.compile(r'^\+?[0-9]+$')
+LOCATION_RE = re.compile(r"^[a-zA-Z0-9\s,.\-]+$")
+LINKEDIN_URL_RE = re.compile(
+    r'^(?:https?://(www\.)?linkedin\.com/in/[\w\-]+/?'
+    r'|https?://(www\.)?linkedin\.com/pub/[\w\-]+/?'
+    r'|linkedin\.com/in/[\w\-]+/?'
+    r'|www\.linkedin\.com/in/[\w\-]+/?)$',
+    re.IGNORECASE
+)
+PORTFOLIO_URL_RE = re.compile(
+    r'^https?://(www\.)?[\w\-]+(\.[\w\-]+)+(/[\w\-._~:/?#[\]@!$&\'()*+,;=]*)?$',
+    re.IGNORECASE
+)
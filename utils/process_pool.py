@@ -0,0 +1,45 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+# Upper bound on worker processes shared by batch analysis and page-parallel extraction
+MAX_WORKERS = 8
+
+# Workers must not be forked from the Streamlit server: it runs background
+# threads (write-behind queue, AI question refill) whose locks a forked child
+# would inherit held. forkserver forks from a clean single-threaded helper;
+# spawn is the fallback where forkserver is unavailable (Windows).
+START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def worker_count():
+    return min(MAX_WORKERS, os.cpu_count() or 1)
+
+
+def in_worker_process():
+    """True when running inside a pool worker, where nested pools must not be started"""
+    return multiprocessing.parent_process() is not None
+
+
+def get_process_pool():
+    """Return the shared process pool, starting it on first use"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=worker_count(), mp_context=multiprocessing.get_context(START_METHOD)
+            )
+        return _executor
+
+
+def reset_process_pool():
+    """Drop a broken pool so the next call starts a fresh one"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
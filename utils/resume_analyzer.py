@@ -1,6 +1,96 @@
-import re
+from config.job_roles import JOB_ROLES
+from utils.extraction_cache import file_bytes, get_extraction_cache
+from utils.keyword_matcher import KeywordMatcher
+from utils.patterns import (
+    ACTION_VERB_RE, BULLET_RE, CONTACT_INFO_RE, DEGREE_RE, EMAIL_RE, GITHUB_RE, GPA_RE,
+    LINKEDIN_RE, PHONE_RE, SUMMARY_CONTACT_WORDS_RE, YEAR_RE
+)
+from utils.text_extraction import PDF_TYPE, extract_pages, get_text_extractor, pypdf_preview, pypdf2_pages
+
+
+def _job_role_skills():
+    """Collect every required and recommended skill listed in JOB_ROLES"""
+    skills = []
+    for roles in JOB_ROLES.values():
+        for role_info in roles.values():
+            skills.extend(role_info.get('required_skills', []))
+            recommended = role_info.get('recommended_skills', {})
+            for group in recommended.values():
+                skills.extend(group)
+    return skills
+
 
 class ResumeAnalyzer:
+    # Keyword vocabularies used to spot the start of each resume section
+    SECTION_KEYWORDS = {
+        'education': [
+            'Education', 'academic', 'qualification', 'degree', 'university', 'college',
+            'school', 'institute', 'certification', 'diploma', 'bachelor', 'master','Computer Engineering','Bachelor of Architecture (B. Arch)'
+            'phd', 'b.tech', 'm.tech', 'B.E', 'M.E','IT', 'b.sc', 'm.sc','bca', 'mca', 'b.com',
+            'm.com', 'b.cs-it', 'imca', 'bba', 'MCA', 'honors',' S.S.C. ',' H.S.C','' ,' XII (GSEB)',' Diploma in Engineering',' Computer Science Engg','Diploma In Engineering- Computer Engineering(CE)'
+        ],
+        'experience': [
+            'experience', 'employment', 'work history', 'professional experience',
+            'work experience', 'career history', 'professional background',
+            'employment history', 'job history', 'positions held', 'experience',
+            'job title', 'job responsibilities', 'job description', 'job summary'
+        ],
+        'projects': [
+            'projects', 'personal projects', 'academic projects', 'key projects',
+            'major projects', 'professional projects', 'project experience',
+            'relevant projects', 'featured projects','latest projects',
+            'top projects'
+        ],
+        'skills': [
+            'skills', 'technical skills', 'competencies', 'expertise',
+            'core competencies', 'professional skills', 'key skills',
+            'technical expertise', 'proficiencies', 'qualifications',
+            'top skills', 'key skill', 'major skill', 'personal skill',
+            'soft skills', 'soft skill', 'soft skillset'
+        ],
+        'summary': [
+            'summary', 'professional summary', 'career summary', 'objective',
+            'career objective', 'professional objective', 'about me', 'profile',
+            'professional profile', 'career profile', 'overview', 'skill summary'
+        ]
+    }
+
+    # Keywords that signal each essential section for the section score
+    ESSENTIAL_SECTIONS = {
+        'Contact': ['email', 'phone', 'address', 'linkedin', 'github', 'portfolio'],
+        'Education': ['Education', 'university', 'college', 'degree', 'academic', 'CGPA', 'GPA','Diploma In Engineering- Computer Engineering(CE)','XII (GSEB)'],
+        'Experience': ['Experience', 'work', 'employment', 'internship', 'projects'],
+        'Skills': ['skills', 'technologies', 'Tools', 'proficiencies', 'expertise']
+    }
+
+    SECTION_WEIGHTS = {
+        'Contact': 15,
+        'Education': 20,
+        'Experience': 40,
+        'Skills': 25
+    }
+
+    # Shared matcher over skills and section vocabularies, built on first use
+    _keyword_matcher = None
+
+    # Penalty and message for each formatting check, in the order _format_issues reports them
+    FORMAT_DEDUCTIONS = [
+        (30, "Resume is too short"),
+        (20, "No clear section headers found (e.g., EDUCATION, EXPERIENCE, SKILLS)"),
+        (20, "No bullet points found for listing details"),
+        (15, "Inconsistent spacing between sections"),
+        (15, "Missing or improperly formatted contact information (Email, Phone, LinkedIn, GitHub)"),
+        (10, "Use standard section names like Education, Work Experience, Skills, Projects")
+    ]
+
+    # Pages read before deciding whether an upload is a resume at all
+    PREVIEW_PAGES = 2
+    # How far a non-resume type must outscore 'resume' on the preview to stop early
+    REJECT_MARGIN = 0.1
+
+    # Common skill separators
+    SKILL_SEPARATORS = [',', '•', '|', '/', '\\', '·', '>', '-', '–', '―']
+
     def __init__(self):
         # Document type indicators
         self.document_types = {
@@ -21,36 +111,116 @@ class ResumeAnalyzer:
                 'date of issue', 'identification'
             ]
         }
+
+        # Lowercase the section vocabularies once instead of on every line
+        self._section_vocab = {
+            name: (
+                [keyword.lower() for keyword in keywords],
+                {keyword.lower() for keyword in keywords}
+            )
+            for name, keywords in self.SECTION_KEYWORDS.items()
+        }
+        self._boundary_keywords = [keyword.lower() for keyword in self.document_types['resume']]
+
+        if ResumeAnalyzer._keyword_matcher is None:
+            vocabulary = [skill.lower() for skill in _job_role_skills()]
+            for keywords in self.document_types.values():
+                vocabulary.extend(keywords)
+            for keywords in self.ESSENTIAL_SECTIONS.values():
+                vocabulary.extend(keywords)
+            ResumeAnalyzer._keyword_matcher = KeywordMatcher(vocabulary)
+
+    def find_keywords(self, text):
+        """Return the set of known keywords present in the lowercased text"""
+        return self._keyword_matcher.found(text.lower())
         
-    def detect_document_type(self, text):
+    def score_document_types(self, text, found_keywords=None):
+        """Score how strongly the text matches each document type's vocabulary"""
         text = text.lower()
+        if found_keywords is None:
+            found_keywords = self._keyword_matcher.found(text)
         scores = {}
         
         # Calculate score for each document type
         for doc_type, keywords in self.document_types.items():
-            matches = sum(1 for keyword in keywords if keyword in text)
+            matches = sum(1 for keyword in keywords if keyword in found_keywords)
             density = matches / len(keywords)
             frequency = matches / (len(text.split()) + 1)  # Add 1 to avoid division by zero
             scores[doc_type] = (density * 0.7) + (frequency * 0.3)
+        return scores
+
+    def detect_document_type(self, text, found_keywords=None):
+        scores = self.score_document_types(text, found_keywords)
         
         # Get the highest scoring document type
         best_match = max(scores.items(), key=lambda x: x[1])
         
         # Only return a document type if the score is significant
         return best_match[0] if best_match[1] > 0.15 else 'unknown'
+
+    def screen_document(self, file, file_type):
+        """Classify a PDF from its first pages; returns (rejection result or None, page count or None).
+
+        The rejection is None when the upload may be a resume, or when the
+        preview has no text (a scan) and needs full extraction to decide; the
+        caller then extracts and analyzes it as usual, passing the page count
+        on so the PDF is not parsed again just to count pages. Files whose
+        text is already cached skip the preview, as do files rejected before,
+        whose document type is cached under the same content hash.
+        """
+        if file_type != PDF_TYPE:
+            return None, None
+
+        data = file_bytes(file)
+        if get_text_extractor().is_cached(data, file_type):
+            return None, None
+        cache = get_extraction_cache()
+        screen_key = cache.make_key('screen', data)
+        rejected_as = cache.get(screen_key)
+        if rejected_as:
+            return self._non_resume_result(rejected_as), None
+
+        try:
+            page_count, pages = pypdf_preview(data, self.PREVIEW_PAGES)
+        except Exception:
+            return None, None
+
+        preview = '\n'.join(pages)
+        if not preview.strip():
+            return None, page_count
+
+        scores = self.score_document_types(preview)
+        doc_type, best_score = max(scores.items(), key=lambda x: x[1])
+        if doc_type == 'resume' or best_score <= 0.15:
+            return None, page_count
+        if best_score - scores['resume'] < self.REJECT_MARGIN:
+            return None, page_count
+        cache.put(screen_key, doc_type)
+        return self._non_resume_result(doc_type), page_count
+
+    def _non_resume_result(self, doc_type):
+        return {
+            'ats_score': 0,
+            'document_type': doc_type,
+            'keyword_match': {'score': 0, 'found_skills': [], 'missing_skills': []},
+            'section_score': 0,
+            'format_score': 0,
+            'suggestions': [f"This appears to be a {doc_type} document. Please upload a resume for ATS analysis."]
+        }
         
-    def calculate_keyword_match(self, resume_text, required_skills):
+    def calculate_keyword_match(self, resume_text, required_skills, found_keywords=None):
         resume_text = resume_text.lower()
+        if found_keywords is None:
+            found_keywords = self._keyword_matcher.found(resume_text)
         found_skills = []
         missing_skills = []
         
         for skill in required_skills:
             skill_lower = skill.lower()
-            # Check for exact match
-            if skill_lower in resume_text:
+            # Known skills come from the single matcher scan; others fall back to a substring test
+            if skill_lower in found_keywords:
                 found_skills.append(skill)
-            # Check for partial matches (e.g., "Python" in "Python programming")
-            elif any(skill_lower in phrase for phrase in resume_text.split('.')):
+            elif skill_lower not in self._keyword_matcher and skill_lower in resume_text:
                 found_skills.append(skill)
             else:
                 missing_skills.append(skill)
@@ -63,65 +233,22 @@ class ResumeAnalyzer:
             'missing_skills': missing_skills
         }
         
-    def check_resume_sections(self, text):
-        text = text.lower()
-        essential_sections = {
-            'Contact': ['email', 'phone', 'address', 'linkedin', 'github', 'portfolio'],
-            'Education': ['Education', 'university', 'college', 'degree', 'academic', 'CGPA', 'GPA','Diploma In Engineering- Computer Engineering(CE)','XII (GSEB)'],
-            'Experience': ['Experience', 'work', 'employment', 'internship', 'projects'],
-            'Skills': ['skills', 'technologies', 'Tools', 'proficiencies', 'expertise']
-        }
+    def check_resume_sections(self, text, found_keywords=None):
+        if found_keywords is None:
+            found_keywords = self._keyword_matcher.found(text.lower())
     
-        weights = {
-            'Contact': 15,
-            'Education': 20,
-            'Experience': 40,
-            'Skills': 25
-        }
+        weights = self.SECTION_WEIGHTS
     
         total_score = 0
-        for section, keywords in essential_sections.items():
-            found = sum(1 for keyword in keywords if keyword in text)
+        for section, keywords in self.ESSENTIAL_SECTIONS.items():
+            found = sum(1 for keyword in keywords if keyword in found_keywords)
             total_score += min(weights[section], (found / len(keywords)) * weights[section])
     
         return round(total_score, 2)
         
-    def check_formatting(self, text):
+    def _format_issues(self, text):
+        """Return one flag per FORMAT_DEDUCTIONS entry, True where the text fails that check"""
         lines = text.split('\n')
-        score = 100
-        deductions = []
-        
-        # Check for minimum content
-        if len(text) < 300:
-            score -= 30
-            deductions.append("Resume is too short")
-            
-        # Check for section headers (all caps words like EDUCATION, EXPERIENCE, etc.)
-        if not any(line.isupper() for line in lines):
-            score -= 20
-            deductions.append("No clear section headers found (e.g., EDUCATION, EXPERIENCE, SKILLS)")
-            
-        # Check for bullet points
-        if not any(line.strip().startswith(('•', '-', '*', '→')) for line in lines):
-            score -= 20
-            deductions.append("No bullet points found for listing details")
-            
-        # Check for consistent spacing
-        if any(len(line.strip()) == 0 and len(next_line.strip()) == 0 
-               for line, next_line in zip(lines[:-1], lines[1:])):
-            score -= 15
-            deductions.append("Inconsistent spacing between sections")
-            
-        # Check for contact information format
-        contact_patterns = [
-            r'\b[\w\.-]+@[\w\.-]+\.\w+\b',      # email
-            r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',   # phone
-            r'linkedin\.com/in/[a-zA-Z0-9-]+',  # LinkedIn
-            r'github\.com/[a-zA-Z0-9-]+',       # GitHub
-        ]
-        if not any(re.search(pattern, text) for pattern in contact_patterns):
-            score -= 15
-            deductions.append("Missing or improperly formatted contact information (Email, Phone, LinkedIn, GitHub)")
         
         # # ATS Formatting Rules - reminders (cannot check fonts in plain text, but can guide)
         # ats_rules = [
@@ -134,39 +261,48 @@ class ResumeAnalyzer:
         
         # Check for non-standard section names (basic check)
         standard_sections = ["Education", "Experience", "Work Experience", "Skills", "Projects", "Certifications", "Summary"]
-        if not any(any(sec in line.lower() for sec in standard_sections) for line in lines):
-            score -= 10
-            deductions.append("Use standard section names like Education, Work Experience, Skills, Projects")
+        
+        return [
+            # Check for minimum content
+            len(text) < 300,
+            # Check for section headers (all caps words like EDUCATION, EXPERIENCE, etc.)
+            not any(line.isupper() for line in lines),
+            # Check for bullet points
+            not any(line.strip().startswith(('•', '-', '*', '→')) for line in lines),
+            # Check for consistent spacing
+            any(len(line.strip()) == 0 and len(next_line.strip()) == 0
+                for line, next_line in zip(lines[:-1], lines[1:])),
+            # Check for contact information format (email, phone, LinkedIn, GitHub) in one scan
+            CONTACT_INFO_RE.search(text) is None,
+            not any(any(sec in line.lower() for sec in standard_sections) for line in lines)
+        ]
+
+    def check_formatting(self, text):
+        score = 100
+        deductions = []
+        
+        for failed, (penalty, message) in zip(self._format_issues(text), self.FORMAT_DEDUCTIONS):
+            if failed:
+                score -= penalty
+                deductions.append(message)
         
         return max(0, score), deductions
 
         
     def extract_text_from_pdf(self, file):
         try:
-            import PyPDF2
-            import io
-            
-            # Create a PDF reader object
             # First make sure we have the file content as bytes
-            if hasattr(file, 'read'):
-                # If it's already a file-like object, read it
-                file_content = file.read()
-                file.seek(0)  # Reset file pointer
-            else:
-                # If it's already bytes
-                file_content = file
-                
-            # Create BytesIO from bytes content
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
-            
-            # Extract text from all pages
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-                
-            return text
+            file_content = file_bytes(file)
+
+            # Re-uploads of the same file skip PDF parsing entirely
+            return get_extraction_cache().get_or_extract('pypdf2', file_content, self._parse_pdf)
         except Exception as e:
             raise Exception(f"Error extracting text from PDF: {str(e)}")
+
+    def _parse_pdf(self, file_content):
+        """Extract text from PDF bytes with PyPDF2"""
+        pages = extract_pages(pypdf2_pages, file_content)
+        return ''.join(page_text + "\n" for page_text in pages)
             
     def extract_text_from_docx(self, docx_file):
         """Extract text from a DOCX file"""
@@ -182,17 +318,11 @@ class ResumeAnalyzer:
 
     def extract_personal_info(self, text):
         """Extract personal information from resume text"""
-        # Basic patterns for personal info
-        email_pattern = r'[\w\.-]+@[\w\.-]+\.\w+'
-        phone_pattern = r'(\+\d{1,3}[-.]?)?\s*\(?\d{3}\)?[-.]?\s*\d{3}[-.]?\s*\d{4}'
-        linkedin_pattern = r'linkedin\.com/in/[\w-]+'
-        github_pattern = r'github\.com/[\w-]+'
-        
         # Extract information
-        email = re.search(email_pattern, text)
-        phone = re.search(phone_pattern, text)
-        linkedin = re.search(linkedin_pattern, text)
-        github = re.search(github_pattern, text)
+        email = EMAIL_RE.search(text)
+        phone = PHONE_RE.search(text)
+        linkedin = LINKEDIN_RE.search(text)
+        github = GITHUB_RE.search(text)
         
         # Get the first line as name (basic assumption)
         name = text.split('\n')[0].strip()
@@ -205,211 +335,77 @@ class ResumeAnalyzer:
             'github': github.group(0) if github else '',
         }
 
-    def extract_education(self, text):
-        """Extract education information from resume text"""
-        education = []
-        lines = text.split('\n')
-        education_keywords = [
-            'Education', 'academic', 'qualification', 'degree', 'university', 'college',
-            'school', 'institute', 'certification', 'diploma', 'bachelor', 'master','Computer Engineering','Bachelor of Architecture (B. Arch)'
-            'phd', 'b.tech', 'm.tech', 'B.E', 'M.E','IT', 'b.sc', 'm.sc','bca', 'mca', 'b.com',
-            'm.com', 'b.cs-it', 'imca', 'bba', 'MCA', 'honors',' S.S.C. ',' H.S.C','' ,' XII (GSEB)',' Diploma in Engineering',' Computer Science Engg','Diploma In Engineering- Computer Engineering(CE)'
-        ]
-        in_education_section = False
-        current_entry = []
-
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in education_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in education_keywords):
-                    # This line contains education info, not just a header
-                    current_entry.append(line)
-                in_education_section = True
-                continue
-            
-            if in_education_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(edu_key.lower() in line.lower() for edu_key in education_keywords):
-                        in_education_section = False
-                        if current_entry:
-                            education.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    education.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            education.append(' '.join(current_entry))
-        
-        return education
+    def segment_sections(self, text, names=None):
+        """Split resume text into sections in a single pass over its lines.
 
-    def extract_experience(self, text):
-        """Extract work experience information from resume text"""
-        experience = []
+        Only the sections in ``names`` are collected (all of them by default).
+        """
         lines = text.split('\n')
-        experience_keywords = [
-            'experience', 'employment', 'work history', 'professional experience',
-            'work experience', 'career history', 'professional background',
-            'employment history', 'job history', 'positions held', 'experience',
-            'job title', 'job responsibilities', 'job description', 'job summary'
-        ]
-        in_experience_section = False
-        current_entry = []
+        states = {
+            name: {'active': False, 'current': [], 'entries': []}
+            for name in (names or self.SECTION_KEYWORDS)
+        }
 
         for line in lines:
             line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in experience_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in experience_keywords):
-                    # This line contains experience info, not just a header
-                    current_entry.append(line)
-                in_experience_section = True
-                continue
-            
-            if in_experience_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(exp_key.lower() in line.lower() for exp_key in experience_keywords):
-                        in_experience_section = False
-                        if current_entry:
-                            experience.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    experience.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            experience.append(' '.join(current_entry))
-        
-        return experience
+            line_lower = line.lower()
+            # Whether this line opens some other resume section, computed once per line
+            is_boundary = None
 
-    def extract_projects(self, text):
-        """Extract project information from resume text"""
-        projects = []
-        lines = text.split('\n')
-        project_keywords = [
-            'projects', 'personal projects', 'academic projects', 'key projects',
-            'major projects', 'professional projects', 'project experience',
-            'relevant projects', 'featured projects','latest projects',
-            'top projects'
-        ]
-        in_project_section = False
-        current_entry = []
+            for name, state in states.items():
+                keywords, headers = self._section_vocab[name]
+                # Check for section header
+                if any(keyword in line_lower for keyword in keywords):
+                    if line_lower not in headers:
+                        # This line contains section info, not just a header
+                        state['current'].append(line)
+                    state['active'] = True
+                    continue
 
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in project_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in project_keywords):
-                    # This line contains project info, not just a header
-                    current_entry.append(line)
-                in_project_section = True
-                continue
-            
-            if in_project_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(proj_key.lower() in line.lower() for proj_key in project_keywords):
-                        in_project_section = False
-                        if current_entry:
-                            projects.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    projects.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            projects.append(' '.join(current_entry))
-        
-        return projects
+                if state['active']:
+                    # Check if we've hit another section
+                    if line:
+                        if is_boundary is None:
+                            is_boundary = any(keyword in line_lower for keyword in self._boundary_keywords)
+                        if is_boundary:
+                            state['active'] = False
+                            if state['current']:
+                                state['entries'].append(' '.join(state['current']))
+                                state['current'] = []
+                            continue
 
-    def extract_skills(self, text):
-        """Extract skills from resume text"""
-        skills = set()  # Use set to avoid duplicates
-        lines = text.split('\n')
-        skills_keywords = [
-            'skills', 'technical skills', 'competencies', 'expertise',
-            'core competencies', 'professional skills', 'key skills',
-            'technical expertise', 'proficiencies', 'qualifications',
-            'top skills', 'key skill', 'major skill', 'personal skill',
-            'soft skills', 'soft skill', 'soft skillset'
-        ]
-        in_skills_section = False
-        current_entry = []
+                    if line:
+                        state['current'].append(line)
+                    elif state['current']:  # Empty line and we have content
+                        state['entries'].append(' '.join(state['current']))
+                        state['current'] = []
 
-        # Common skill separators
-        separators = [',', '•', '|', '/', '\\', '·', '>', '-', '–', '―']
+        sections = {}
+        for name, state in states.items():
+            if state['current']:
+                state['entries'].append(' '.join(state['current']))
+            sections[name] = state['entries']
 
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in skills_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in skills_keywords):
-                    # This line contains skills, not just a header
-                    current_entry.append(line)
-                in_skills_section = True
-                continue
-            
-            if in_skills_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(skill_key.lower() in line.lower() for skill_key in skills_keywords):
-                        in_skills_section = False
-                        if current_entry:
-                            # Process the current entry
-                            text_to_process = ' '.join(current_entry)
-                            # Split by common separators
-                            for separator in separators:
-                                if separator in text_to_process:
-                                    skills.update(skill.strip() for skill in text_to_process.split(separator) if skill.strip())
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    # Process the current entry
-                    text_to_process = ' '.join(current_entry)
-                    # Split by common separators
-                    for separator in separators:
-                        if separator in text_to_process:
-                            skills.update(skill.strip() for skill in text_to_process.split(separator) if skill.strip())
-                    current_entry = []
-        
-        if current_entry:
-            # Process any remaining skills
-            text_to_process = ' '.join(current_entry)
-            for separator in separators:
+        if 'skills' in sections:
+            sections['skills'] = self._split_skills(sections['skills'])
+        if 'summary' in sections:
+            sections['summary'] = self._build_summary(lines, sections['summary'])
+        return sections
+
+    def _split_skills(self, entries):
+        """Break skills section entries into individual skills"""
+        skills = set()  # Use set to avoid duplicates
+        for text_to_process in entries:
+            # Split by common separators
+            for separator in self.SKILL_SEPARATORS:
                 if separator in text_to_process:
                     skills.update(skill.strip() for skill in text_to_process.split(separator) if skill.strip())
-        
         return list(skills)
 
-    def extract_summary(self, text):
-        """Extract summary/objective from resume text"""
+    def _build_summary(self, lines, entries):
+        """Combine an unlabelled opening paragraph with any marked summary section"""
         summary = []
-        lines = text.split('\n')
-        summary_keywords = [
-            'summary', 'professional summary', 'career summary', 'objective',
-            'career objective', 'professional objective', 'about me', 'profile',
-            'professional profile', 'career profile', 'overview', 'skill summary'
-        ]
-        in_summary_section = False
-        current_entry = []
+        summary_keywords = self._section_vocab['summary'][0]
 
         # Try to find summary at the beginning of the resume
         start_index = 0
@@ -418,53 +414,42 @@ class ResumeAnalyzer:
 
         # Check first few non-empty lines for potential summary
         first_lines = []
-        lines_checked = 0
         for line in lines[start_index:]:
             if line.strip():
                 first_lines.append(line.strip())
-                lines_checked += 1
-                if lines_checked >= 5:  # Check first 5 non-empty lines
+                if len(first_lines) >= 5:  # Check first 5 non-empty lines
                     break
 
         # If first few lines look like a summary (no special formatting, no contact info)
         if first_lines and not any(keyword in first_lines[0].lower() for keyword in summary_keywords):
             potential_summary = ' '.join(first_lines)
             if len(potential_summary.split()) > 10:  # More than 10 words
-                if not re.search(r'\b(?:email|phone|address|tel|mobile|linkedin)\b', potential_summary.lower()):
+                if not SUMMARY_CONTACT_WORDS_RE.search(potential_summary.lower()):
                     summary.append(potential_summary)
 
-        # Look for explicitly marked summary section
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in summary_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in summary_keywords):
-                    # This line contains summary info, not just a header
-                    current_entry.append(line)
-                in_summary_section = True
-                continue
-            
-            if in_summary_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(sum_key.lower() in line.lower() for sum_key in summary_keywords):
-                        in_summary_section = False
-                        if current_entry:
-                            summary.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    summary.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            summary.append(' '.join(current_entry))
-        
+        summary.extend(entries)
         return ' '.join(summary) if summary else ''
 
+    def extract_education(self, text):
+        """Extract education information from resume text"""
+        return self.segment_sections(text, ['education'])['education']
+
+    def extract_experience(self, text):
+        """Extract work experience information from resume text"""
+        return self.segment_sections(text, ['experience'])['experience']
+
+    def extract_projects(self, text):
+        """Extract project information from resume text"""
+        return self.segment_sections(text, ['projects'])['projects']
+
+    def extract_skills(self, text):
+        """Extract skills from resume text"""
+        return self.segment_sections(text, ['skills'])['skills']
+
+    def extract_summary(self, text):
+        """Extract summary/objective from resume text"""
+        return self.segment_sections(text, ['summary'])['summary']
+
     def analyze_resume(self, resume_data, job_requirements):
         """Analyze resume and return scores and recommendations"""
         try:
@@ -473,31 +458,28 @@ class ResumeAnalyzer:
             # Extract personal information
             personal_info = self.extract_personal_info(text)
             
+            # Scan once for every known skill and section keyword
+            found_keywords = self.find_keywords(text)
+
             # First detect document type
-            doc_type = self.detect_document_type(text)
+            doc_type = self.detect_document_type(text, found_keywords)
             if doc_type != 'resume':
-                return {
-                    'ats_score': 0,
-                    'document_type': doc_type,
-                    'keyword_match': {'score': 0, 'found_skills': [], 'missing_skills': []},
-                    'section_score': 0,
-                    'format_score': 0,
-                    'suggestions': [f"This appears to be a {doc_type} document. Please upload a resume for ATS analysis."]
-                }
+                return self._non_resume_result(doc_type)
                 
             # Calculate keyword match
             required_skills = job_requirements.get('required_skills', [])
-            keyword_match = self.calculate_keyword_match(text, required_skills)
+            keyword_match = self.calculate_keyword_match(text, required_skills, found_keywords)
             
-            # Extract all resume sections
-            education = self.extract_education(text)
-            experience = self.extract_experience(text)
-            projects = self.extract_projects(text)
-            skills = list(self.extract_skills(text))  # Convert skills set to list
-            summary = self.extract_summary(text)
+            # Extract all resume sections in one pass
+            sections = self.segment_sections(text)
+            education = sections['education']
+            experience = sections['experience']
+            projects = sections['projects']
+            skills = sections['skills']
+            summary = sections['summary']
             
             # Check resume sections
-            section_score = self.check_resume_sections(text)
+            section_score = self.check_resume_sections(text, found_keywords)
             
             # Check formatting
             format_score, format_deductions = self.check_formatting(text)
@@ -537,10 +519,9 @@ class ResumeAnalyzer:
                     experience_suggestions.append(
         "Add your work experience section. \n\n\n For Example:\n\n **Cognifyz Technologies (Remote)**          \n           Python Development Intern  |  Apr 2025 – May 2025\n\n • Strengthened core Python programming skills by working on real-world tasks and projects, gaining hands-on experience in writing efficient, structured, and reusable code for different use cases.\n\n • Designed and developed a series of mini-projects such as guessing games, password checkers, and file analyzers, which enhanced problem-solving abilities.\n\n • Created and implemented data visualization dashboards using Matplotlib and Seaborn to represent datasets in an intuitive and meaningful way, enabling better analysis and interpretation of insights.")
             else:
-                has_dates = any(re.search(r'\b(19|20)\d{2}\b', exp) for exp in experience)
-                has_bullets = any(re.search(r'[•\-\*]', exp) for exp in experience)
-                has_action_verbs = any(re.search(r'\b(developed|managed|created|implemented|designed|led|improved)\b', 
-                                               exp.lower()) for exp in experience)
+                has_dates = any(YEAR_RE.search(exp) for exp in experience)
+                has_bullets = any(BULLET_RE.search(exp) for exp in experience)
+                has_action_verbs = any(ACTION_VERB_RE.search(exp.lower()) for exp in experience)
                 
                 if not has_dates:
                     experience_suggestions.append("Include dates for each work experience")
@@ -558,11 +539,9 @@ class ResumeAnalyzer:
                     "Aug 2022 – Jun 2026 | CGPA: 8.09/10"
                 )
             else:
-                has_dates = any(re.search(r'\b(19|20)\d{2}\b', edu) for edu in education)
-                has_degree = any(re.search(r'\b(bachelor|master|phd|b\.|m\.|diploma)\b',
-                                           edu.lower()) for edu in education)
-                has_gpa = any(re.search(r'\b(gpa|cgpa|grade|percentage)\b',
-                                        edu.lower()) for edu in education)
+                has_dates = any(YEAR_RE.search(edu) for edu in education)
+                has_degree = any(DEGREE_RE.search(edu.lower()) for edu in education)
+                has_gpa = any(GPA_RE.search(edu.lower()) for edu in education)
             
                 if not has_dates:
                     education_suggestions.append(
@@ -658,4 +637,4 @@ class ResumeAnalyzer:
                 'section_score': 0,
                 'format_score': 0,
                 'suggestions': [f"Error analyzing resume: {str(e)}. Please check your file and try again."]
-            }
\ No newline at end of file
+            }
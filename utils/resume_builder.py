@@ -8,9 +8,13 @@ from docx.oxml.ns import nsdecls
 from io import BytesIO
 import tempfile
 import traceback
-import re
 from typing import Dict, List, Tuple
 
+from utils.patterns import (
+    EMAIL_ADDRESS_RE, FULL_NAME_RE, LINKEDIN_URL_RE, LOCATION_RE, PHONE_DIGITS_RE,
+    PHONE_SEPARATORS_RE, PORTFOLIO_URL_RE
+)
+
 
 class ResumeBuilder:
     def __init__(self):
@@ -116,7 +120,7 @@ class ResumeBuilder:
         if len(name_parts) < 2:
             return False, "Please provide both first and last name"
         
-        if not re.match(r"^[a-zA-Z\s\-'\.]+$", name):
+        if not FULL_NAME_RE.match(name):
             return False, "Name can only contain letters, spaces, hyphens, and apostrophes"
         
         if len(name) > 100:
@@ -131,9 +135,7 @@ class ResumeBuilder:
         
         email = email.strip().lower()
         
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        
-        if not re.match(email_pattern, email):
+        if not EMAIL_ADDRESS_RE.match(email):
             return False, "Invalid email format (e.g., user@example.com)"
         
         if '..' in email:
@@ -154,9 +156,9 @@ class ResumeBuilder:
         
         phone = phone.strip()
         
-        cleaned_phone = re.sub(r'[\s\-\(\)\.]', '', phone)
+        cleaned_phone = PHONE_SEPARATORS_RE.sub('', phone)
         
-        if not re.match(r'^\+?[0-9]+$', cleaned_phone):
+        if not PHONE_DIGITS_RE.match(cleaned_phone):
             return False, "Phone number can only contain digits and optional + prefix"
         
         if len(cleaned_phone) < 10:
@@ -180,7 +182,7 @@ class ResumeBuilder:
         if len(location) > 200:
             return False, "Location is too long (maximum 200 characters)"
         
-        if not re.match(r"^[a-zA-Z0-9\s,.\-]+$", location):
+        if not LOCATION_RE.match(location):
             return False, "Location contains invalid characters"
         
         return True, "Valid"
@@ -192,14 +194,8 @@ class ResumeBuilder:
         
         linkedin = linkedin.strip()
         
-        linkedin_patterns = [
-            r'^https?://(www\.)?linkedin\.com/in/[\w\-]+/?$',
-            r'^https?://(www\.)?linkedin\.com/pub/[\w\-]+/?$',
-            r'^linkedin\.com/in/[\w\-]+/?$',
-            r'^www\.linkedin\.com/in/[\w\-]+/?$'
-        ]
-        
-        is_valid = any(re.match(pattern, linkedin, re.IGNORECASE) for pattern in linkedin_patterns)
+        # One pattern covers the /in/, /pub/, bare and www. forms
+        is_valid = LINKEDIN_URL_RE.match(linkedin) is not None
         
         if not is_valid:
             return False, "Invalid LinkedIn URL format (e.g., https://linkedin.com/in/username)"
@@ -216,9 +212,7 @@ class ResumeBuilder:
         
         portfolio = portfolio.strip()
         
-        url_pattern = r'^https?://(www\.)?[\w\-]+(\.[\w\-]+)+(/[\w\-._~:/?#[\]@!$&\'()*+,;=]*)?$'
-        
-        if not re.match(url_pattern, portfolio, re.IGNORECASE):
+        if not PORTFOLIO_URL_RE.match(portfolio):
             return False, "Invalid URL format (e.g., https://www.example.com)"
         
         if len(portfolio) > 500:
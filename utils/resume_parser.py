@@ -1,8 +1,10 @@
-import pypdf
 import docx
 import re
 from io import BytesIO
 
+from utils.extraction_cache import file_bytes, get_extraction_cache
+from utils.text_extraction import extract_pages, pypdf_pages
+
 class ResumeParser:
     def __init__(self):
         pass
@@ -10,35 +12,21 @@ class ResumeParser:
     def extract_text_from_pdf(self, pdf_file):
         try:
             # Handle different file input types
-            if hasattr(pdf_file, 'read'):
-                # If it's a file-like object
-                file_content = pdf_file.read()
-                pdf_file.seek(0)  # Reset file pointer
-            else:
-                # If it's already bytes
-                file_content = pdf_file
-                
-            pdf_reader = pypdf.PdfReader(BytesIO(file_content))
-            text = ""
-            for page in pdf_reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-                else:
-                    # Handle empty page text
-                    text += "\n"
-            return text.strip()
+            file_content = file_bytes(pdf_file)
+            return get_extraction_cache().get_or_extract('pypdf', file_content, self._parse_pdf)
         except Exception as e:
             print(f"Error extracting text from PDF: {e}")
             return ""
+
+    def _parse_pdf(self, file_content):
+        # Empty pages still contribute their line break
+        pages = extract_pages(pypdf_pages, file_content)
+        return ''.join(page_text + "\n" for page_text in pages).strip()
             
     def extract_text_from_docx(self, docx_file):
         try:
             doc = docx.Document(BytesIO(docx_file.read()))
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text.strip()
+            return ''.join(paragraph.text + "\n" for paragraph in doc.paragraphs).strip()
         except Exception as e:
             print(f"Error extracting text from DOCX: {e}")
             return ""
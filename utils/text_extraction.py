@@ -0,0 +1,319 @@
+import io
+import math
+import os
+import sqlite3
+import threading
+import time
+import warnings
+from concurrent.futures.process import BrokenProcessPool
+
+from utils.extraction_cache import CACHE_DIR, file_bytes, get_extraction_cache
+from utils.process_pool import get_process_pool, in_worker_process, reset_process_pool, worker_count
+
+PDF_TYPE = "application/pdf"
+DOCX_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+# Below these thresholds an extraction is treated as suspect and the next backend is tried
+MIN_CHARS_PER_PAGE = 40
+MIN_PRINTABLE_RATIO = 0.85
+MIN_WORD_CHAR_RATIO = 0.5
+
+# PDFs longer than this are split into page ranges extracted in worker processes
+PARALLEL_PAGE_THRESHOLD = 8
+
+# Backend outcomes are counted in SQLite so extractions run in pool workers
+# (batch analysis) add to the same totals as the Streamlit process
+STATS_DB_PATH = os.path.join(CACHE_DIR, 'extraction_stats.db')
+
+
+def pypdf_pages(data, start=0, stop=None):
+    """Return the text of each page in [start, stop) using pypdf"""
+    import pypdf
+    reader = pypdf.PdfReader(io.BytesIO(data))
+    return [page.extract_text() or '' for page in reader.pages[start:stop]]
+
+
+def pypdf2_pages(data, start=0, stop=None):
+    """Return the text of each page in [start, stop) using PyPDF2"""
+    import PyPDF2
+    reader = PyPDF2.PdfReader(io.BytesIO(data))
+    return [page.extract_text() or '' for page in reader.pages[start:stop]]
+
+
+def pdfplumber_pages(data, start=0, stop=None):
+    """Return the text of each page in [start, stop) using pdfplumber, blanking pages that fail"""
+    import pdfplumber
+    pages = []
+    with pdfplumber.open(io.BytesIO(data)) as pdf:
+        for page in pdf.pages[start:stop]:
+            try:
+                with warnings.catch_warnings():
+                    warnings.filterwarnings("ignore")
+                    pages.append(page.extract_text() or '')
+            except Exception:
+                pages.append('')
+    return pages
+
+
+def count_pdf_pages(data):
+    """Return the page count of a PDF without extracting any text"""
+    import pypdf
+    return len(pypdf.PdfReader(io.BytesIO(data)).pages)
+
+
+def pypdf_preview(data, pages):
+    """Return (page count, text of the first ``pages`` pages) from a single pypdf parse"""
+    import pypdf
+    reader = pypdf.PdfReader(io.BytesIO(data))
+    return len(reader.pages), [page.extract_text() or '' for page in reader.pages[:pages]]
+
+
+def extract_pages(page_function, data, page_count=None):
+    """Run a PDF page function over the whole document.
+
+    Documents over PARALLEL_PAGE_THRESHOLD pages are split into one
+    contiguous page range per worker and extracted in the shared process
+    pool; the page lists are stitched back together in order. Short files,
+    calls made from inside a worker, and pool failures use a single serial
+    pass instead. Pass ``page_count`` when it is already known to skip
+    the parse that counts pages.
+    """
+    if in_worker_process():
+        return page_function(data)
+
+    if page_count is None:
+        try:
+            page_count = count_pdf_pages(data)
+        except Exception:
+            return page_function(data)
+    if page_count <= PARALLEL_PAGE_THRESHOLD:
+        return page_function(data)
+
+    chunk_size = max(PARALLEL_PAGE_THRESHOLD // 2, math.ceil(page_count / worker_count()))
+    try:
+        pool = get_process_pool()
+        futures = [
+            pool.submit(page_function, data, start, min(start + chunk_size, page_count))
+            for start in range(0, page_count, chunk_size)
+        ]
+        pages = []
+        for future in futures:
+            pages.extend(future.result())
+        return pages
+    except (BrokenProcessPool, OSError, RuntimeError) as e:
+        print(f"Page-parallel extraction unavailable, extracting serially: {e}")
+        reset_process_pool()
+        return page_function(data)
+
+
+def docx_pages(data):
+    """Return the paragraphs of a DOCX file as a single page"""
+    from docx import Document
+    doc = Document(io.BytesIO(data))
+    return ['\n'.join(paragraph.text for paragraph in doc.paragraphs)]
+
+
+def plain_text_pages(data):
+    return [data.decode()]
+
+
+def quality_problem(text, page_count):
+    """Return why extracted text looks wrong (empty, garbled, too sparse), or '' if it looks fine"""
+    stripped = text.strip()
+    if not stripped:
+        return 'empty'
+
+    printable = sum(1 for char in stripped if char.isprintable() or char in '\n\t')
+    if printable / len(stripped) < MIN_PRINTABLE_RATIO:
+        return 'garbled'
+    # Replacement characters mean the font encoding could not be decoded
+    if stripped.count('\ufffd') > len(stripped) * 0.05:
+        return 'garbled'
+
+    non_space = [char for char in stripped if not char.isspace()]
+    word_chars = sum(1 for char in non_space if char.isalnum())
+    if non_space and word_chars / len(non_space) < MIN_WORD_CHAR_RATIO:
+        return 'garbled'
+    # pdfminer-based backends emit "(cid:NN)" for glyphs they cannot map
+    if stripped.count('(cid:') * 8 > len(stripped) * 0.3:
+        return 'garbled'
+
+    if len(stripped) / max(page_count, 1) < MIN_CHARS_PER_PAGE:
+        return 'low density'
+    return ''
+
+
+class ExtractionBackend:
+    """A named text extractor for one file type"""
+
+    def __init__(self, name, file_type, extract_pages, priority):
+        self.name = name
+        self.file_type = file_type
+        self.extract_pages = extract_pages
+        self.priority = priority
+
+
+class TextExtractionService:
+    """Extract text from uploads by trying registered backends fastest first.
+
+    The next backend only runs when the current one raises or its output
+    looks wrong, so a normal file is parsed once. The best text seen is
+    returned if every backend produces a suspect result. Each backend's
+    calls, outcomes and time are counted in ``stats_db_path``.
+    """
+
+    def __init__(self, stats_db_path=STATS_DB_PATH):
+        self.stats_db_path = stats_db_path
+        self._backends = {}
+        self._lock = threading.Lock()
+        self._stats_ready = False
+
+    def register(self, name, file_type, extract_pages, priority):
+        """Add or replace a backend; lower priority values are tried first"""
+        with self._lock:
+            self._backends[name] = ExtractionBackend(name, file_type, extract_pages, priority)
+
+    def backends_for(self, file_type):
+        return sorted(
+            (backend for backend in self._backends.values() if backend.file_type == file_type),
+            key=lambda backend: backend.priority
+        )
+
+    def set_priority(self, name, priority):
+        self._backends[name].priority = priority
+
+    def extract(self, file, file_type, page_count=None):
+        """Return the text of an upload, raising an Exception if no backend can read it.
+
+        ``page_count`` is the PDF's page count if the caller already has it.
+        """
+        data = file_bytes(file)
+        return get_extraction_cache().get_or_extract(
+            f"auto:{file_type}", data, lambda content: self._extract_uncached(content, file_type, page_count)
+        )
+
+    def is_cached(self, file, file_type):
+        """Whether extract() would answer this upload from the cache without parsing it"""
+        cache = get_extraction_cache()
+        return cache.get(cache.make_key(f"auto:{file_type}", file_bytes(file))) is not None
+
+    def _extract_uncached(self, data, file_type, page_count=None):
+        backends = self.backends_for(file_type)
+        if not backends:
+            return plain_text_pages(data)[0]
+
+        best_text = ''
+        errors = []
+        for backend in backends:
+            started = time.perf_counter()
+            try:
+                if backend.file_type == PDF_TYPE:
+                    pages = extract_pages(backend.extract_pages, data, page_count)
+                else:
+                    pages = backend.extract_pages(data)
+            except Exception as e:
+                self._record(backend, started, failed=True)
+                errors.append(f"{backend.name}: {str(e)}")
+                continue
+
+            text = '\n'.join(pages)
+            problem = quality_problem(text, len(pages))
+            self._record(backend, started, rejected=bool(problem))
+            if not problem:
+                return text
+
+            errors.append(f"{backend.name}: {problem}")
+            if len(text.strip()) > len(best_text.strip()):
+                best_text = text
+
+        if best_text.strip():
+            return best_text
+        raise Exception(f"All text extraction methods failed ({'; '.join(errors)})")
+
+    def _connect_stats(self):
+        if not self._stats_ready:
+            os.makedirs(os.path.dirname(self.stats_db_path) or '.', mode=0o700, exist_ok=True)
+        conn = sqlite3.connect(self.stats_db_path, timeout=5)
+        if not self._stats_ready:
+            conn.execute('''
+            CREATE TABLE IF NOT EXISTS extraction_stats (
+                backend TEXT PRIMARY KEY,
+                calls INTEGER NOT NULL DEFAULT 0,
+                accepted INTEGER NOT NULL DEFAULT 0,
+                rejected INTEGER NOT NULL DEFAULT 0,
+                failures INTEGER NOT NULL DEFAULT 0,
+                total_seconds REAL NOT NULL DEFAULT 0
+            )
+            ''')
+            conn.commit()
+            self._stats_ready = True
+        return conn
+
+    def _record(self, backend, started, failed=False, rejected=False):
+        elapsed = time.perf_counter() - started
+        accepted = not failed and not rejected
+        try:
+            conn = self._connect_stats()
+            try:
+                conn.execute('''
+                INSERT INTO extraction_stats (backend, calls, accepted, rejected, failures, total_seconds)
+                VALUES (?, 1, ?, ?, ?, ?)
+                ON CONFLICT(backend) DO UPDATE SET
+                    calls = calls + 1,
+                    accepted = accepted + excluded.accepted,
+                    rejected = rejected + excluded.rejected,
+                    failures = failures + excluded.failures,
+                    total_seconds = total_seconds + excluded.total_seconds
+                ''', (backend.name, int(accepted), int(rejected), int(failed), elapsed))
+                conn.commit()
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError) as e:
+            print(f"Could not record extraction stats: {e}")
+
+    def get_stats(self):
+        """Return per-backend timing and success statistics, totalled across processes"""
+        try:
+            conn = self._connect_stats()
+            try:
+                rows = {row[0]: row[1:] for row in conn.execute(
+                    'SELECT backend, calls, accepted, rejected, failures, total_seconds FROM extraction_stats'
+                )}
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError) as e:
+            print(f"Could not read extraction stats: {e}")
+            rows = {}
+
+        stats = []
+        for backend in sorted(self._backends.values(), key=lambda b: (b.file_type, b.priority)):
+            calls, accepted, rejected, failures, total_seconds = rows.get(backend.name, (0, 0, 0, 0, 0.0))
+            stats.append({
+                'name': backend.name,
+                'file_type': backend.file_type,
+                'priority': backend.priority,
+                'calls': calls,
+                'accepted': accepted,
+                'rejected': rejected,
+                'failures': failures,
+                'success_rate': round(accepted / calls, 3) if calls else 0,
+                'avg_seconds': round(total_seconds / calls, 4) if calls else 0
+            })
+        return stats
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_text_extractor():
+    """Return the process-wide extraction service with the default backends registered"""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = TextExtractionService()
+            _service.register('pypdf', PDF_TYPE, pypdf_pages, priority=10)
+            _service.register('pypdf2', PDF_TYPE, pypdf2_pages, priority=20)
+            _service.register('pdfplumber', PDF_TYPE, pdfplumber_pages, priority=30)
+            _service.register('python-docx', DOCX_TYPE, docx_pages, priority=10)
+        return _service